@@ -280,19 +280,17 @@ def calculate_kaz_era(sales: pd.DataFrame, listings: pd.DataFrame, as_of_date) -
 
 
 if __name__ == "__main__":
-    import glob
-
-    # Find CSV files
+    # Find CSV files (exports are date-stamped, so the latest is the greatest name)
     csv_dir = Path.home() / "Desktop" / "glasshouse"
-    sales_files = list(csv_dir.glob("opendoor-home-sales-*.csv"))
-    listings_files = list(csv_dir.glob("opendoor-for-sale-listings-*.csv"))
+    latest_sales = max(csv_dir.glob("opendoor-home-sales-*.csv"), key=lambda p: p.name, default=None)
+    latest_listings = max(csv_dir.glob("opendoor-for-sale-listings-*.csv"), key=lambda p: p.name, default=None)
 
-    if not sales_files or not listings_files:
+    if not latest_sales or not latest_listings:
         logger.error("CSV files not found in ~/Desktop/glasshouse/")
         sys.exit(1)
 
-    sales_path = str(sales_files[0])
-    listings_path = str(listings_files[0])
+    sales_path = str(latest_sales)
+    listings_path = str(latest_listings)
 
     logger.info(f"Sales: {sales_path}")
     logger.info(f"Listings: {listings_path}")
@@ -25,11 +25,13 @@ import sqlite3
 import pandas as pd
 import re
 import json
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from difflib import SequenceMatcher
 import logging
 
 from src.config import get_cohort
+from src.db.database import apply_bulk_pragmas
 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +41,28 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Address normalization lookups, compiled once at import
+_DIRECTION_MAP = {
+    'north': 'n', 'south': 's', 'east': 'e', 'west': 'w',
+    'northeast': 'ne', 'northwest': 'nw', 'southeast': 'se', 'southwest': 'sw',
+}
+_STREET_TYPE_MAP = {
+    'street': 'st', 'avenue': 'ave', 'boulevard': 'blvd',
+    'drive': 'dr', 'lane': 'ln', 'road': 'rd',
+    'court': 'ct', 'place': 'pl', 'circle': 'cir',
+    'terrace': 'ter', 'highway': 'hwy', 'parkway': 'pkwy',
+    'cove': 'cv', 'trail': 'trl', 'way': 'way',
+}
+_DIRECTION_RE = re.compile(r'\b(' + '|'.join(_DIRECTION_MAP) + r')\b')
+_STREET_TYPE_RE = re.compile(r'\b(' + '|'.join(_STREET_TYPE_MAP) + r')\b')
+
+_DATE_FORMATS = (
+    '%b %d, %Y',   # Jan 29, 2026
+    '%Y-%m-%d',    # 2026-01-29
+    '%m/%d/%Y',    # 01/29/2026
+)
+
+
 def normalize_address(address: str) -> str:
     """
     Normalize address for consistent matching.
@@ -49,24 +73,9 @@ def normalize_address(address: str) -> str:
 
     addr = str(address).lower().strip()
 
-    # Standardize direction prefixes/suffixes
-    direction_map = {
-        'north': 'n', 'south': 's', 'east': 'e', 'west': 'w',
-        'northeast': 'ne', 'northwest': 'nw', 'southeast': 'se', 'southwest': 'sw',
-    }
-    for full, abbr in direction_map.items():
-        addr = re.sub(rf'\b{full}\b', abbr, addr)
-
-    # Standardize street type abbreviations
-    street_types = [
-        ('street', 'st'), ('avenue', 'ave'), ('boulevard', 'blvd'),
-        ('drive', 'dr'), ('lane', 'ln'), ('road', 'rd'),
-        ('court', 'ct'), ('place', 'pl'), ('circle', 'cir'),
-        ('terrace', 'ter'), ('highway', 'hwy'), ('parkway', 'pkwy'),
-        ('cove', 'cv'), ('trail', 'trl'), ('way', 'way'),
-    ]
-    for full, abbr in street_types:
-        addr = re.sub(rf'\b{full}\b', abbr, addr)
+    # Standardize direction prefixes/suffixes and street type abbreviations
+    addr = _DIRECTION_RE.sub(lambda m: _DIRECTION_MAP[m.group(1)], addr)
+    addr = _STREET_TYPE_RE.sub(lambda m: _STREET_TYPE_MAP[m.group(1)], addr)
 
     # Remove periods, commas, extra spaces, # symbols
     addr = addr.replace('.', '').replace(',', '').replace('#', ' ')
@@ -75,34 +84,24 @@ def normalize_address(address: str) -> str:
     return addr
 
 
-def parse_price(price_str):
-    """Parse price string like '$589,000' to float."""
-    if pd.isna(price_str) or price_str == '':
-        return None
-    if isinstance(price_str, (int, float)):
-        return float(price_str)
-    return float(str(price_str).replace('$', '').replace(',', '').strip() or '0')
-
+def parse_price(prices: pd.Series) -> pd.Series:
+    """Parse a column of price strings like '$589,000' to floats (NaN if missing)."""
+    if pd.api.types.is_numeric_dtype(prices):
+        return prices.astype(float)
+    cleaned = prices.astype(str).str.replace(r'[$,\s]', '', regex=True)
+    return pd.to_numeric(cleaned, errors='coerce').astype(float)
 
-def parse_date(date_str):
-    """Parse date string to YYYY-MM-DD format."""
-    if pd.isna(date_str) or date_str == '':
-        return None
 
-    # Try multiple formats
-    formats = [
-        '%b %d, %Y',   # Jan 29, 2026
-        '%Y-%m-%d',    # 2026-01-29
-        '%m/%d/%Y',    # 01/29/2026
-    ]
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(str(date_str).strip(), fmt).strftime('%Y-%m-%d')
-        except ValueError:
-            continue
-
-    return None
+def parse_date(dates: pd.Series) -> pd.Series:
+    """Parse a column of date strings to YYYY-MM-DD strings (NaN if unparseable)."""
+    dates = dates.astype(str).str.strip()
+    parsed = pd.Series(pd.NaT, index=dates.index, dtype='datetime64[ns]')
+    for fmt in _DATE_FORMATS:
+        missing = parsed.isna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(dates[missing], format=fmt, errors='coerce')
+    return parsed.dt.strftime('%Y-%m-%d')
 
 
 def fuzzy_match_score(str1: str, str2: str) -> float:
@@ -149,7 +148,7 @@ def load_parcl_sales(csv_path: str) -> pd.DataFrame:
     # Parse numeric columns
     for col in ['sale_price', 'purchase_price', 'realized_net']:
         if col in df.columns:
-            df[col] = df[col].apply(parse_price)
+            df[col] = parse_price(df[col])
 
     # Parse days_held
     if 'days_held' in df.columns:
@@ -158,7 +157,7 @@ def load_parcl_sales(csv_path: str) -> pd.DataFrame:
     # Parse dates
     for col in ['sale_date', 'purchase_date']:
         if col in df.columns:
-            df[col] = df[col].apply(parse_date)
+            df[col] = parse_date(df[col])
 
     # Ensure property_id is string
     if 'property_id' in df.columns:
@@ -180,21 +179,21 @@ def load_parcl_listings(csv_path: str) -> pd.DataFrame:
     price_cols = ['original_purchase_price', 'initial_listing_price', 'latest_listing_price']
     for col in price_cols:
         if col in df.columns:
-            df[col] = df[col].apply(parse_price)
+            df[col] = parse_price(df[col])
 
     # Parse dates
     date_cols = ['original_purchase_date', 'initial_listing_date', 'latest_listing_date']
     for col in date_cols:
         if col in df.columns:
-            df[col] = df[col].apply(parse_date)
+            df[col] = parse_date(df[col])
 
     # Create normalized address
     if 'address' in df.columns:
-        df['address_normalized'] = df.apply(
-            lambda row: normalize_address(
-                f"{row['address']} {row.get('city', '')} {row.get('state', '')}"
-            ), axis=1
-        )
+        full_address = df['address'].fillna('').astype(str)
+        for col in ('city', 'state'):
+            if col in df.columns:
+                full_address = full_address + ' ' + df[col].fillna('').astype(str)
+        df['address_normalized'] = full_address.map(normalize_address)
 
     # Ensure property_id is string
     if 'property_id' in df.columns:
@@ -230,9 +229,8 @@ def get_sales_log_records(db_path: str) -> list:
     return records
 
 
-def update_sales_record(db_path: str, record_id: int, updates: dict):
-    """Update a sales_log record with enriched data."""
-    conn = sqlite3.connect(db_path)
+def update_sales_record(conn: sqlite3.Connection, record_id: int, updates: dict):
+    """Update a sales_log record with enriched data (caller commits)."""
     cursor = conn.cursor()
 
     set_clauses = []
@@ -248,9 +246,6 @@ def update_sales_record(db_path: str, record_id: int, updates: dict):
         values.append(record_id)
         cursor.execute(query, values)
 
-    conn.commit()
-    conn.close()
-
 
 def backfill_purchase_data(
     db_path: str,
@@ -264,9 +259,13 @@ def backfill_purchase_data(
     logger.info("BACKFILL PURCHASE DATA")
     logger.info("=" * 60)
 
-    # Load data sources
-    parcl_sales = load_parcl_sales(sales_csv_path)
-    parcl_listings = load_parcl_listings(listings_csv_path)
+    # Load data sources; the two CSVs are independent, so parse them in
+    # parallel (database writes below stay on this thread)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sales_future = executor.submit(load_parcl_sales, sales_csv_path)
+        listings_future = executor.submit(load_parcl_listings, listings_csv_path)
+        parcl_sales = sales_future.result()
+        parcl_listings = listings_future.result()
 
     # Create lookup dictionaries
     # 1. Property ID lookup from sales
@@ -312,6 +311,11 @@ def backfill_purchase_data(
     enriched_records = []
     still_missing_records = []
 
+    # All updates go through one connection in a single transaction
+    conn = sqlite3.connect(db_path)
+    apply_bulk_pragmas(conn)
+    conn.execute("BEGIN IMMEDIATE")
+
     for record in records:
         record_id = record['id']
         updates = {}
@@ -399,9 +403,8 @@ def backfill_purchase_data(
 
             if purchase_date and sale_date:
                 try:
-                    pd_dt = datetime.strptime(purchase_date, '%Y-%m-%d')
-                    sd_dt = datetime.strptime(sale_date, '%Y-%m-%d')
-                    updates['days_held'] = (sd_dt - pd_dt).days
+                    updates['days_held'] = (date.fromisoformat(sale_date) -
+                                            date.fromisoformat(purchase_date)).days
                 except:
                     pass
 
@@ -412,7 +415,7 @@ def backfill_purchase_data(
 
         # Apply updates
         if updates:
-            update_sales_record(db_path, record_id, updates)
+            update_sales_record(conn, record_id, updates)
 
             # Track stats
             if match_method == 'property_id':
@@ -442,6 +445,9 @@ def backfill_purchase_data(
                 'property_id': record.get('property_id'),
             })
 
+    conn.commit()
+    conn.close()
+
     # Generate report
     report = {
         'timestamp': datetime.now().isoformat(),
@@ -485,8 +491,6 @@ def backfill_purchase_data(
 
 
 if __name__ == "__main__":
-    import glob
-
     # Paths
     project_root = Path(__file__).parent.parent
     db_path = project_root / "data" / "glasshouse.db"
@@ -494,19 +498,20 @@ if __name__ == "__main__":
 
     # Find CSV files
     csv_dir = Path.home() / "Desktop" / "glasshouse"
-    sales_files = sorted(csv_dir.glob("opendoor-home-sales-*.csv"), reverse=True)
-    listings_files = sorted(csv_dir.glob("opendoor-for-sale-listings-*.csv"), reverse=True)
+    # Exports are date-stamped, so the latest file is the greatest name
+    latest_sales = max(csv_dir.glob("opendoor-home-sales-*.csv"), key=lambda p: p.name, default=None)
+    latest_listings = max(csv_dir.glob("opendoor-for-sale-listings-*.csv"), key=lambda p: p.name, default=None)
 
-    if not sales_files:
+    if not latest_sales:
         logger.error("No sales CSV files found in ~/Desktop/glasshouse/")
         sys.exit(1)
 
-    if not listings_files:
+    if not latest_listings:
         logger.error("No listings CSV files found in ~/Desktop/glasshouse/")
         sys.exit(1)
 
-    sales_path = str(sales_files[0])
-    listings_path = str(listings_files[0])
+    sales_path = str(latest_sales)
+    listings_path = str(latest_listings)
 
     logger.info(f"Sales CSV:    {sales_path}")
     logger.info(f"Listings CSV: {listings_path}")
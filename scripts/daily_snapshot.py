@@ -232,12 +232,11 @@ def upsert_snapshots(db: Database, listings: List[Dict], dry_run: bool = False)
         # Track by status
         stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
 
-        if dry_run:
-            continue
-
-        # Upsert to database
-        property_id, is_new, transition = db.upsert_property_snapshot(listing)
+    if dry_run:
+        return stats
 
+    # Upsert to database in one batch
+    for property_id, is_new, transition in db.upsert_property_snapshots(listings):
         if is_new:
             stats['new_properties'] += 1
         else:
@@ -12,6 +12,10 @@ Usage:
 import sys
 import json
 import os
+import time
+import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -28,6 +32,8 @@ except ImportError:
 # Add parent to path for local imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.config import get_cohorts
+
 # Claude API for narrative generation
 try:
     import anthropic
@@ -35,6 +41,13 @@ try:
 except ImportError:
     HAS_ANTHROPIC = False
 
+# Fast JSON serialization (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Unit Economics and Market P&L
 try:
     from src.metrics.unit_economics import UnitEconomicsCalculator
@@ -45,6 +58,16 @@ try:
 except ImportError:
     HAS_ANALYTICS = False
 
+# Reporting windows (ISO date strings, compared against ISO-formatted dates)
+Q1_START = '2026-01-01'
+Q4_START = '2025-10-01'
+Q4_END = '2025-12-31'
+
+# Job title keywords for careers role counts
+AI_TITLE_KEYWORDS = ('AI', 'ML', 'Data Scientist', 'Machine Learning')
+SENIOR_TITLE_KEYWORDS = ('Senior', 'Director', 'Manager', 'Lead', 'VP')
+
+
 def find_latest_file(directory: Path, pattern: str) -> Path:
     """Find the most recent file matching pattern."""
     files = list(directory.glob(pattern))
@@ -53,6 +76,93 @@ def find_latest_file(directory: Path, pattern: str) -> Path:
     return max(files, key=lambda f: f.stat().st_mtime)
 
 
+def load_json(path: Path):
+    """Load a JSON file, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _json_default(obj):
+    """Convert numpy scalars/arrays for json.dump."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def _run_in_background(fn, *args):
+    """Start fn(*args) on a one-off worker thread and return its Future.
+
+    The executor is shut down straight after submit, so the worker exits once
+    the call finishes even if the caller never collects the result.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(fn, *args)
+    finally:
+        executor.shutdown(wait=False)
+
+
+MARKET_SUMMARY_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+def _source_fingerprint(paths) -> str:
+    """Cheap key for input files: resolved path, mtime and size of each one."""
+    digest = hashlib.blake2b(str(Q1_START).encode(), digest_size=8)
+    for path in paths:
+        st = path.stat()
+        digest.update(f"|{path.resolve()}|{st.st_mtime_ns}|{st.st_size}".encode())
+    return digest.hexdigest()
+
+
+def get_market_summary(q1_sales: pd.DataFrame, listings_data: pd.DataFrame,
+                       source_files, cache_dir: Path) -> dict:
+    """
+    Run MarketPnLAnalyzer, reusing a cached summary when the inputs are unchanged.
+
+    The cache key covers the CSVs the two frames were read from (path, mtime
+    and size), so re-exported data invalidates the cached summary. If the key
+    can't be computed the analyzer simply runs uncached. Both paths return the
+    JSON-coerced summary, so callers see the same types either way.
+    """
+    try:
+        key = _source_fingerprint(source_files)
+    except OSError:
+        key = None
+
+    cache_file = None
+    if key is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        for stale in cache_dir.glob("market_summary_*.json"):
+            if now - stale.stat().st_mtime > MARKET_SUMMARY_CACHE_TTL:
+                stale.unlink(missing_ok=True)
+
+        cache_file = cache_dir / f"market_summary_{key}.json"
+        if cache_file.exists():
+            try:
+                with open(cache_file) as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+
+    market_summary = json.loads(
+        json.dumps(MarketPnLAnalyzer(q1_sales, listings_data).get_summary(), default=_json_default)
+    )
+    if cache_file is not None:
+        try:
+            with open(cache_file, 'w') as f:
+                json.dump(market_summary, f)
+        except OSError:
+            pass
+    return market_summary
+
+
 def main():
     project_root = Path(__file__).parent.parent
     output_dir = project_root / "outputs"
@@ -139,14 +249,11 @@ def main():
     KAZ_ERA_START = pd.Timestamp('2025-09-10')
 
     # Filter to Q1 2026
-    q1_start = '2026-01-01'
-    q1_sales = sales[sales['sale_date'] >= q1_start].copy()
-    q1_daily = daily[daily['date'] >= q1_start].copy()
+    q1_sales = sales[sales['sale_date'] >= Q1_START].copy()
+    q1_daily = daily[daily['date'] >= Q1_START].copy()
 
     # Q4 2025 data (for earnings estimates)
-    q4_start = '2025-10-01'
-    q4_end = '2025-12-31'
-    q4_sales = sales[(sales['sale_date'] >= q4_start) & (sales['sale_date'] <= q4_end)].copy()
+    q4_sales = sales[(sales['sale_date'] >= Q4_START) & (sales['sale_date'] <= Q4_END)].copy()
 
     q1_metrics = metrics['q1_2026']
 
@@ -434,18 +541,8 @@ def main():
     sales_with_days = q1_sales[q1_sales['days_held'].notna()].copy()
 
     if len(sales_with_days) > 0:
-        # Define cohorts
-        def get_cohort(days):
-            if days < 90:
-                return 'new'
-            elif days < 180:
-                return 'mid'
-            elif days < 365:
-                return 'old'
-            else:
-                return 'toxic'
-
-        sales_with_days['cohort'] = sales_with_days['days_held'].apply(get_cohort)
+        # Classify all rows at once against the config cohort boundaries
+        sales_with_days['cohort'] = get_cohorts(pd.to_numeric(sales_with_days['days_held'], errors='coerce'))
 
         cohorts = {}
         for cohort_name in ['new', 'mid', 'old', 'toxic']:
@@ -659,8 +756,11 @@ def main():
     }
 
     # ==== THIS WEEK NARRATIVE (AI-powered) ====
-    this_week_narrative = generate_this_week_narrative(dashboard_data, dashboard_data_file)
-    dashboard_data['this_week_narrative'] = this_week_narrative
+    # Generated in the background so the Claude API round-trip overlaps the
+    # pandas work below; the result is collected just before saving.
+    narrative_future = _run_in_background(
+        generate_this_week_narrative, dict(dashboard_data), dashboard_data_file
+    )
 
     # ==== UNIT ECONOMICS (True margins after all costs) ====
     if HAS_ANALYTICS and len(q1_sales) > 0:
@@ -701,8 +801,9 @@ def main():
     if HAS_ANALYTICS and listings_data is not None and len(q1_sales) > 0:
         try:
             print("Analyzing market-level P&L...")
-            analyzer = MarketPnLAnalyzer(q1_sales, listings_data)
-            market_summary = analyzer.get_summary()
+            market_summary = get_market_summary(
+                q1_sales, listings_data, (sales_file, listings_file), output_dir / ".cache"
+            )
 
             if market_summary and market_summary.get('markets'):
                 dashboard_data['market_pnl'] = {
@@ -726,27 +827,32 @@ def main():
     try:
         print("Loading sales funnel data...")
 
-        # Load Opendoor direct inventory (active listings)
+        # Opendoor direct inventory (active listings), pending/sold listings
+        # (from MLS scraper) and pending JSON metrics are independent reads,
+        # so load them concurrently
         opendoor_inventory_file = find_latest_file(output_dir, "opendoor_listings_*.csv")
+        pending_csv_file = find_latest_file(output_dir, "pending_listings_*.csv")
+        pending_json_file = find_latest_file(output_dir, "pending_*.json")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            inventory_future = executor.submit(pd.read_csv, opendoor_inventory_file) if opendoor_inventory_file else None
+            pending_csv_future = executor.submit(pd.read_csv, pending_csv_file) if pending_csv_file else None
+            pending_json_future = executor.submit(load_json, pending_json_file) if pending_json_file else None
+
         opendoor_inventory = None
-        if opendoor_inventory_file:
-            opendoor_inventory = pd.read_csv(opendoor_inventory_file)
+        if inventory_future:
+            opendoor_inventory = inventory_future.result()
             print(f"  Loaded {len(opendoor_inventory)} active Opendoor listings")
 
-        # Load pending/sold listings (from MLS scraper)
-        pending_csv_file = find_latest_file(output_dir, "pending_listings_*.csv")
         pending_listings = None
-        if pending_csv_file:
-            pending_listings = pd.read_csv(pending_csv_file)
+        if pending_csv_future:
+            pending_listings = pending_csv_future.result()
             print(f"  Loaded {len(pending_listings)} pending/sold Opendoor listings")
 
-        # Load pending JSON for metrics
-        pending_json_file = find_latest_file(output_dir, "pending_*.json")
         pending_metrics = {}
-        if pending_json_file:
-            with open(pending_json_file) as f:
-                pending_data = json.load(f)
-                pending_metrics = pending_data.get('metrics', {})
+        if pending_json_future:
+            pending_data = pending_json_future.result()
+            pending_metrics = pending_data.get('metrics', {})
 
         # Build comprehensive sales funnel data
         sales_funnel = {
@@ -755,30 +861,32 @@ def main():
 
         # Active inventory stats
         if opendoor_inventory is not None and len(opendoor_inventory) > 0:
+            price_agg = opendoor_inventory['price'].agg(['sum', 'mean']) if 'price' in opendoor_inventory.columns else None
             sales_funnel['active_inventory'] = {
                 'total': len(opendoor_inventory),
-                'total_value': int(opendoor_inventory['price'].sum()) if 'price' in opendoor_inventory.columns else 0,
-                'avg_price': int(opendoor_inventory['price'].mean()) if 'price' in opendoor_inventory.columns else 0,
+                'total_value': int(price_agg['sum']) if price_agg is not None else 0,
+                'avg_price': int(price_agg['mean']) if price_agg is not None else 0,
                 'by_market': opendoor_inventory['market'].value_counts().head(10).to_dict() if 'market' in opendoor_inventory.columns else {},
             }
 
         # Sales/pending stats
         if pending_listings is not None and len(pending_listings) > 0:
+            price_agg = pending_listings['list_price'].agg(['sum', 'mean']) if 'list_price' in pending_listings.columns else None
             sales_funnel['recent_sales'] = {
                 'total': len(pending_listings),
-                'total_value': int(pending_listings['list_price'].sum()) if 'list_price' in pending_listings.columns else 0,
-                'avg_price': int(pending_listings['list_price'].mean()) if 'list_price' in pending_listings.columns else 0,
-                'by_market': pending_listings['search_market'].value_counts().to_dict() if 'search_market' in pending_listings.columns else {},
-                'by_agent': pending_listings['agent_name'].value_counts().to_dict() if 'agent_name' in pending_listings.columns else {},
+                'total_value': int(price_agg['sum']) if price_agg is not None else 0,
+                'avg_price': int(price_agg['mean']) if price_agg is not None else 0,
+                'by_market': pending_listings['search_market'].value_counts().head(20).to_dict() if 'search_market' in pending_listings.columns else {},
+                'by_agent': pending_listings['agent_name'].value_counts().head(20).to_dict() if 'agent_name' in pending_listings.columns else {},  # Top 20 only
             }
 
             # Calculate days-to-pending for each sale
             if 'list_date' in pending_listings.columns and 'pending_date' in pending_listings.columns:
-                pending_listings['list_date_dt'] = pd.to_datetime(pending_listings['list_date'], errors='coerce')
-                pending_listings['pending_date_dt'] = pd.to_datetime(pending_listings['pending_date'], errors='coerce')
-                pending_listings['days_to_pending'] = (pending_listings['pending_date_dt'] - pending_listings['list_date_dt']).dt.days
+                list_date_dt = pd.to_datetime(pending_listings['list_date'], errors='coerce')
+                pending_date_dt = pd.to_datetime(pending_listings['pending_date'], errors='coerce')
+                pending_listings['days_to_pending'] = (pending_date_dt - list_date_dt).dt.days
 
-                valid_days = pending_listings['days_to_pending'].dropna()
+                valid_days = pending_listings['days_to_pending'].dropna().to_numpy()
                 if len(valid_days) > 0:
                     sales_funnel['recent_sales']['avg_days_to_pending'] = int(valid_days.mean())
                     sales_funnel['recent_sales']['min_days_to_pending'] = int(valid_days.min())
@@ -802,7 +910,13 @@ def main():
 
             # Top sales (highest prices)
             if 'list_price' in pending_listings.columns:
-                top_sales = pending_listings.nlargest(5, 'list_price')[['scraped_address', 'city', 'state', 'list_price', 'search_market']].to_dict('records')
+                # Partial select of the top 5 (O(n)) instead of sorting all rows
+                prices = pending_listings['list_price'].to_numpy(dtype=float, na_value=np.nan)
+                valid_idx = np.flatnonzero(~np.isnan(prices))
+                k = min(5, len(valid_idx))
+                top_idx = valid_idx[np.argpartition(prices[valid_idx], -k)[-k:]] if k > 0 else valid_idx
+                top_idx = top_idx[np.argsort(-prices[top_idx], kind='stable')]
+                top_sales = pending_listings.iloc[top_idx][['scraped_address', 'city', 'state', 'list_price', 'search_market']].to_dict('records')
                 sales_funnel['recent_sales']['top_sales'] = top_sales
 
         # Calculate turnover metrics
@@ -877,18 +991,16 @@ def main():
         total_jobs = careers_data.get('total_jobs', len(jobs))
 
         # Count by department
-        dept_counts = {}
-        location_counts = {}
+        dept_counts = Counter()
+        location_counts = Counter()
         for job in jobs:
-            dept = job.get('department', 'Other')
-            loc = job.get('location', 'Unknown')
-            dept_counts[dept] = dept_counts.get(dept, 0) + 1
+            dept_counts[job.get('department', 'Other')] += 1
             # Extract city from location
-            city = loc.split(',')[0].replace('Office - ', '').strip()
-            location_counts[city] = location_counts.get(city, 0) + 1
+            loc = job.get('location', 'Unknown')
+            location_counts[loc.split(',')[0].replace('Office - ', '').strip()] += 1
 
         # Get top location
-        top_location = max(location_counts.items(), key=lambda x: x[1])[0] if location_counts else 'Unknown'
+        top_location = location_counts.most_common(1)[0][0] if location_counts else 'Unknown'
 
         # Count specific categories
         eng_count = dept_counts.get('Engineering & Technology', 0)
@@ -896,13 +1008,10 @@ def main():
         finance_count = dept_counts.get('Finance & Accounting', 0) + dept_counts.get('Legal', 0)
         growth_count = dept_counts.get('Marketing & Growth', 0)
 
-        # Count AI/ML roles
-        ai_count = sum(1 for j in jobs if 'AI' in j.get('title', '') or 'ML' in j.get('title', '') or
-                       'Data Scientist' in j.get('title', '') or 'Machine Learning' in j.get('title', ''))
-
-        # Count senior roles
-        senior_count = sum(1 for j in jobs if 'Senior' in j.get('title', '') or 'Director' in j.get('title', '') or
-                          'Manager' in j.get('title', '') or 'Lead' in j.get('title', '') or 'VP' in j.get('title', ''))
+        # Count AI/ML and senior roles
+        titles = [j.get('title', '') for j in jobs]
+        ai_count = sum(1 for t in titles if any(kw in t for kw in AI_TITLE_KEYWORDS))
+        senior_count = sum(1 for t in titles if any(kw in t for kw in SENIOR_TITLE_KEYWORDS))
 
         dashboard_data['careers'] = {
             'total_jobs': total_jobs,
@@ -913,8 +1022,8 @@ def main():
             'ai_ml': ai_count,
             'senior': senior_count,
             'top_location': top_location,
-            'department_breakdown': dept_counts,
-            'location_breakdown': dict(sorted(location_counts.items(), key=lambda x: -x[1])[:10]),
+            'department_breakdown': dict(dept_counts),
+            'location_breakdown': dict(location_counts.most_common(10)),
         }
         print(f"  Added careers: {total_jobs} jobs, {eng_count} engineering, {ai_count} AI/ML")
 
@@ -945,7 +1054,7 @@ def main():
             weekly = accountability_data.get('weekly_contracts', [])
             for w in weekly:
                 week_date = w.get('week', '')
-                if week_date >= '2025-10-01' and week_date <= '2025-12-31':
+                if Q4_START <= week_date <= Q4_END:
                     q4_acq += w.get('actual', 0)
 
         # Days until earnings (Feb 19, 2026)
@@ -960,10 +1069,21 @@ def main():
         }
         print(f"  Added Q4 estimates: {q4_homes_sold} homes, ${q4_revenue/1e6:.1f}M revenue, {q4_acq} acquisitions")
 
+    # ==== THIS WEEK NARRATIVE (collect background result) ====
+    dashboard_data['this_week_narrative'] = narrative_future.result()
+
     # ==== SAVE OUTPUT ====
     output_file = output_dir / "unified_dashboard_data.json"
-    with open(output_file, 'w') as f:
-        json.dump(dashboard_data, f, indent=2, default=str)
+    if HAS_ORJSON:
+        # orjson encodes in C and handles numpy scalars natively
+        output_file.write_bytes(orjson.dumps(
+            dashboard_data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(dashboard_data, f, indent=2, default=str)
 
     print(f"\nSaved: {output_file}")
 
@@ -1124,19 +1244,61 @@ Return ONLY the JSON, no other text."""
     return json.loads(text)
 
 
+# Narrative rule thresholds
+KAZ_WIN_RATE_STABLE = 94
+NEW_COHORT_WIN_RATE_STABLE = 95
+DAILY_VELOCITY_WATCH = 27
+KAZ_UNDERWATER_WATCH = 2
+
+# Narrative rule flag bits
+RULE_TOXIC_DOWN = 1 << 0
+RULE_UNDERWATER_DOWN = 1 << 1
+RULE_KAZ_WIN_RATE_STABLE = 1 << 2
+RULE_NEW_COHORT_STRONG = 1 << 3
+RULE_VELOCITY_BELOW_TARGET = 1 << 4
+RULE_KAZ_UNDERWATER_HIGH = 1 << 5
+
+
+def narrative_rule_flags(toxic_curr, toxic_prev, uw_curr, uw_prev,
+                         kaz_wr, new_wr, daily_vel, kaz_uw):
+    """
+    Evaluate the numeric narrative rules as a bitmask of RULE_* flags.
+
+    Accepts scalars or equal-length numpy arrays (one element per week),
+    so a full weekly history can be scored in a single vectorized pass.
+    """
+    return (
+        np.greater(toxic_prev, toxic_curr) * RULE_TOXIC_DOWN
+        | np.greater(uw_prev, uw_curr) * RULE_UNDERWATER_DOWN
+        | np.greater_equal(kaz_wr, KAZ_WIN_RATE_STABLE) * RULE_KAZ_WIN_RATE_STABLE
+        | np.greater_equal(new_wr, NEW_COHORT_WIN_RATE_STABLE) * RULE_NEW_COHORT_STRONG
+        | np.less(daily_vel, DAILY_VELOCITY_WATCH) * RULE_VELOCITY_BELOW_TARGET
+        | np.greater(kaz_uw, KAZ_UNDERWATER_WATCH) * RULE_KAZ_UNDERWATER_HIGH
+    )
+
+
 def generate_narrative_rules(context):
     """Fallback rule-based narrative generation."""
     narrative = {'improving': [], 'stable': [], 'watching': []}
 
+    new_cohort = context['cohorts'].get('new', {})
+    daily_vel = context['velocity'].get('daily_avg_sales', 22)
+    flags = int(narrative_rule_flags(
+        context['toxic']['current'], context['toxic']['previous'],
+        context['underwater']['current'], context['underwater']['previous'],
+        context['kaz_era']['win_rate'], new_cohort.get('win_rate', 0),
+        daily_vel, context['kaz_era']['underwater'],
+    ))
+
     # IMPROVING
-    toxic_change = context['toxic']['previous'] - context['toxic']['current']
-    if toxic_change > 0:
+    if flags & RULE_TOXIC_DOWN:
+        toxic_change = context['toxic']['previous'] - context['toxic']['current']
         narrative['improving'].append(
             f"Toxic inventory down {toxic_change} homes ({context['toxic']['previous']} → {context['toxic']['current']})"
         )
 
-    underwater_change = context['underwater']['previous'] - context['underwater']['current']
-    if underwater_change > 0:
+    if flags & RULE_UNDERWATER_DOWN:
+        underwater_change = context['underwater']['previous'] - context['underwater']['current']
         narrative['improving'].append(
             f"Legacy underwater down {underwater_change} homes"
         )
@@ -1145,19 +1307,17 @@ def generate_narrative_rules(context):
             narrative['improving'].append(f"Underwater exposure improved ${exposure // 1000}K")
 
     # STABLE
-    if context['kaz_era']['win_rate'] >= 94:
+    if flags & RULE_KAZ_WIN_RATE_STABLE:
         narrative['stable'].append(f"Kaz-era win rate holding ({context['kaz_era']['win_rate']}%)")
 
-    new_cohort = context['cohorts'].get('new', {})
-    if new_cohort.get('win_rate', 0) >= 95:
+    if flags & RULE_NEW_COHORT_STRONG:
         narrative['stable'].append(f"New cohort performance strong ({new_cohort['win_rate']}% WR)")
 
     # WATCHING
-    daily_vel = context['velocity'].get('daily_avg_sales', 22)
-    if daily_vel < 27:
+    if flags & RULE_VELOCITY_BELOW_TARGET:
         narrative['watching'].append(f"Daily velocity below target ({round(daily_vel)} vs 29 needed)")
 
-    if context['kaz_era']['underwater'] > 2:
+    if flags & RULE_KAZ_UNDERWATER_HIGH:
         narrative['watching'].append(f"Kaz-era underwater at {context['kaz_era']['underwater']} homes")
 
     return narrative
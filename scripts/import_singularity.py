@@ -23,6 +23,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pandas as pd
 
+# Arrow-backed CSV parsing (optional)
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 
 def import_from_clipboard():
     """Import data pasted from Singularity tracker table."""
@@ -30,6 +37,8 @@ def import_from_clipboard():
 
     try:
         df = pd.read_clipboard()
+        if HAS_PYARROW:
+            df = df.convert_dtypes(dtype_backend='pyarrow')
         print(f"Found {len(df)} rows")
         print(f"Columns: {list(df.columns)}")
 
@@ -78,7 +87,10 @@ def import_from_file(filepath: str):
         return None
 
     print(f"Reading: {filepath}")
-    df = pd.read_csv(filepath)
+    if HAS_PYARROW:
+        df = pd.read_csv(filepath, engine='pyarrow', dtype_backend='pyarrow')
+    else:
+        df = pd.read_csv(filepath)
     print(f"Found {len(df)} rows")
     print(f"Columns: {list(df.columns)}")
 
@@ -9,12 +9,16 @@ This script combines:
 Usage:
     python scripts/merge_datasets.py
     python scripts/merge_datasets.py --output-dir ./data
+    python scripts/merge_datasets.py --parquet   # also write Parquet copies
 """
 
+import os
 import sys
 import json
+import fnmatch
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
@@ -22,6 +26,20 @@ from typing import Optional, Tuple
 import pandas as pd
 import numpy as np
 
+# Multi-threaded Arrow CSV parser (optional)
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Fast JSON serialization (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(message)s',
@@ -29,13 +47,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parcl exports dates like "Jan 29, 2026"
+PARCL_DATE_FORMAT = '%b %d, %Y'
+
+# Column dtypes for the Singularity sales export, applied by read_csv
+SINGULARITY_SALES_DTYPES = {
+    'list_price': 'float64',
+    'living_square_footage': 'float32',
+    'beds': 'float32',
+    'baths': 'float32',
+}
+
+# Compact dtypes for the unified sales columns: day counts fit Int16 (nullable,
+# ~89 years) and property details need no more than float32
+UNIFIED_SALES_DTYPES = {
+    'days_held': 'Int16',
+    'beds': 'float32',
+    'baths': 'float32',
+    'sqft': 'float32',
+}
+
+# Provenance of each unified sale record
+SALE_SOURCES = ['matched', 'singularity_only', 'parcl_only']
+
 
 def find_latest_file(directory: Path, pattern: str) -> Optional[Path]:
     """Find the most recent file matching pattern."""
-    files = list(directory.glob(pattern))
-    if not files:
+    try:
+        with os.scandir(directory) as entries:
+            latest = max(
+                (e for e in entries if fnmatch.fnmatch(e.name, pattern)),
+                key=lambda e: e.stat().st_mtime,
+                default=None,
+            )
+    except FileNotFoundError:
         return None
-    return max(files, key=lambda f: f.stat().st_mtime)
+    return Path(latest.path) if latest else None
+
+
+def parse_price(values: pd.Series) -> pd.Series:
+    """Parse '$589,000'-style prices; blanks and '$0' become NaN."""
+    raw = values.astype(str).str.strip()
+    prices = pd.to_numeric(raw.str.replace(r'[$,]', '', regex=True), errors='coerce')
+    return prices.mask(raw == '$0').astype(float)
+
+
+def parse_realized(values: pd.Series) -> pd.Series:
+    """Parse realized net values, treating '($12,345)' as negative."""
+    raw = values.astype(str).str.strip()
+    negative = raw.str.contains('(', regex=False).fillna(False)
+    cleaned = raw.str.replace(r'[$,()]', '', regex=True)
+    realized = pd.to_numeric(cleaned, errors='coerce').mask(raw == '$0').astype(float)
+    return realized.where(~negative, -realized)
 
 
 def load_parcl_data(sales_path: Path, listings_path: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -57,29 +120,15 @@ def load_parcl_data(sales_path: Path, listings_path: Path) -> Tuple[pd.DataFrame
         'Buyer Entity': 'buyer_entity',
     })
 
-    # Parse dates
-    sales['sale_date'] = pd.to_datetime(sales['sale_date_raw'], format='%b %d, %Y', errors='coerce')
-    sales['purchase_date'] = pd.to_datetime(sales['purchase_date_raw'], format='%b %d, %Y', errors='coerce')
-
-    # Parse prices (remove $, commas)
-    def parse_price(val):
-        if pd.isna(val) or val == '$0' or val == '':
-            return np.nan
-        return float(str(val).replace('$', '').replace(',', ''))
-
-    sales['sale_price'] = sales['sale_price_raw'].apply(parse_price)
-    sales['purchase_price'] = sales['purchase_price_raw'].apply(parse_price)
+    # Parse dates in one pass with the known format; malformed values become NaT
+    sales['sale_date'] = pd.to_datetime(sales['sale_date_raw'], format=PARCL_DATE_FORMAT, errors='coerce')
+    sales['purchase_date'] = pd.to_datetime(sales['purchase_date_raw'], format=PARCL_DATE_FORMAT, errors='coerce')
 
-    # Parse realized net (handle parentheses for negatives)
-    def parse_realized(val):
-        if pd.isna(val) or val == '' or val == '$0':
-            return np.nan
-        s = str(val).replace('$', '').replace(',', '')
-        if '(' in s:
-            s = '-' + s.replace('(', '').replace(')', '')
-        return float(s)
-
-    sales['realized_net'] = sales['realized_net_raw'].apply(parse_realized)
+    # Parse prices and realized net, one vectorized pass per column
+    sales['sale_price'] = parse_price(sales['sale_price_raw'])
+    sales['purchase_price'] = parse_price(sales['purchase_price_raw'])
+    sales['realized_net'] = parse_realized(sales['realized_net_raw'])
+    sales['days_held'] = pd.to_numeric(sales['days_held'], errors='coerce').round().astype('Int16')
 
     # Add source flag
     sales['source'] = 'parcl'
@@ -97,7 +146,12 @@ def load_parcl_data(sales_path: Path, listings_path: Path) -> Tuple[pd.DataFrame
 def load_singularity_data(sales_path: Path, daily_path: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Load and normalize Singularity data."""
     logger.info(f"Loading Singularity sales: {sales_path}")
-    sales = pd.read_csv(sales_path)
+    sales = pd.read_csv(
+        sales_path,
+        parse_dates=['sold_date'],
+        dtype=SINGULARITY_SALES_DTYPES,
+        engine='pyarrow' if HAS_PYARROW else 'c',
+    )
 
     # Normalize column names
     sales = sales.rename(columns={
@@ -117,13 +171,35 @@ def load_singularity_data(sales_path: Path, daily_path: Path) -> Tuple[pd.DataFr
 
     # Load daily timeseries
     logger.info(f"Loading Singularity daily: {daily_path}")
-    daily = pd.read_csv(daily_path)
-    daily['date'] = pd.to_datetime(daily['date'])
+    daily = pd.read_csv(daily_path, parse_dates=['date'])
     logger.info(f"  Loaded {len(daily)} days of timeseries")
 
     return sales, daily
 
 
+def greedy_claim(parcl_pos: np.ndarray, sing_pos: np.ndarray, n_sing: int) -> np.ndarray:
+    """
+    Resolve candidate pairs into a greedy 1-1 matching.
+
+    Pairs must be sorted by Parcl row, then preference (closest price first).
+    Each Parcl row takes its first candidate whose Singularity row is not
+    already claimed. Returns the positions of the kept pairs.
+    """
+    claimed = bytearray(n_sing)
+    keep = np.empty(len(parcl_pos), dtype=np.int64)
+    n_kept = 0
+    last_parcl = -1
+    # Plain ints iterate far faster than numpy scalars in a Python loop
+    for i, (p, s) in enumerate(zip(parcl_pos.tolist(), sing_pos.tolist())):
+        if p == last_parcl or claimed[s]:
+            continue
+        claimed[s] = 1
+        last_parcl = p
+        keep[n_kept] = i
+        n_kept += 1
+    return keep[:n_kept]
+
+
 def match_records(parcl: pd.DataFrame, sing: pd.DataFrame,
                   price_tolerance: float = 0.05) -> pd.DataFrame:
     """
@@ -133,52 +209,44 @@ def match_records(parcl: pd.DataFrame, sing: pd.DataFrame,
     """
     logger.info("Matching records between datasets...")
 
-    # Ensure date columns are date objects for comparison
-    parcl = parcl.copy()
-    sing = sing.copy()
-    parcl['match_date'] = parcl['sale_date'].dt.date
-    sing['match_date'] = sing['sale_date'].dt.date
-
-    matches = []
-    parcl_matched_idx = set()
-    sing_matched_idx = set()
-
-    for p_idx, p_row in parcl.iterrows():
-        if pd.isna(p_row['sale_price']) or p_row['sale_price'] == 0:
-            continue
+    # Candidate pairs: one hash join on sale date, then a price band filter.
+    # Rows without a date or price can never match and are left out.
+    p_valid = parcl['sale_date'].notna() & parcl['sale_price'].notna() & (parcl['sale_price'] != 0)
+    s_valid = sing['sale_date'].notna() & sing['sale_price'].notna()
+    p_side = pd.DataFrame({
+        'parcl_idx': parcl.index[p_valid],
+        'parcl_pos': np.flatnonzero(p_valid),
+        'date': parcl.loc[p_valid, 'sale_date'].dt.floor('D').to_numpy(),
+        'parcl_price': parcl.loc[p_valid, 'sale_price'].to_numpy(),
+    })
+    s_side = pd.DataFrame({
+        'sing_idx': sing.index[s_valid],
+        'sing_pos': np.flatnonzero(s_valid),
+        'date': sing.loc[s_valid, 'sale_date'].dt.floor('D').to_numpy(),
+        'sing_price': sing.loc[s_valid, 'sale_price'].to_numpy(),
+    })
 
-        p_date = p_row['match_date']
-        p_price = p_row['sale_price']
-
-        # Find candidates with same date and similar price
-        candidates = sing[
-            (sing['match_date'] == p_date) &
-            (sing['sale_price'].between(p_price * (1 - price_tolerance),
-                                         p_price * (1 + price_tolerance))) &
-            (~sing.index.isin(sing_matched_idx))
-        ]
-
-        if len(candidates) > 0:
-            # Take closest price match
-            candidates = candidates.copy()
-            candidates['price_diff'] = abs(candidates['sale_price'] - p_price)
-            best_match = candidates.loc[candidates['price_diff'].idxmin()]
-            s_idx = best_match.name
-
-            parcl_matched_idx.add(p_idx)
-            sing_matched_idx.add(s_idx)
-
-            matches.append({
-                'parcl_idx': p_idx,
-                'sing_idx': s_idx,
-                'date': p_date,
-                'parcl_price': p_price,
-                'sing_price': best_match['sale_price'],
-                'price_diff': best_match['price_diff'],
-            })
-
-    match_df = pd.DataFrame(matches)
-    logger.info(f"  Matched {len(matches)} records")
+    candidates = p_side.merge(s_side, on='date')
+    in_band = (
+        (candidates['sing_price'] >= candidates['parcl_price'] * (1 - price_tolerance)) &
+        (candidates['sing_price'] <= candidates['parcl_price'] * (1 + price_tolerance))
+    )
+    candidates = candidates[in_band]
+    candidates = candidates.assign(
+        price_diff=(candidates['sing_price'] - candidates['parcl_price']).abs()
+    ).sort_values(['parcl_pos', 'price_diff', 'sing_pos'], kind='stable')
+
+    # Greedy 1-1 assignment in Parcl row order, closest price first
+    keep = greedy_claim(candidates['parcl_pos'].to_numpy(),
+                        candidates['sing_pos'].to_numpy(), len(sing))
+
+    match_df = candidates.iloc[keep][
+        ['parcl_idx', 'sing_idx', 'date', 'parcl_price', 'sing_price', 'price_diff']
+    ].reset_index(drop=True)
+    parcl_matched_idx = set(match_df['parcl_idx'])
+    sing_matched_idx = set(match_df['sing_idx'])
+
+    logger.info(f"  Matched {len(match_df)} records")
     logger.info(f"  Parcl unmatched: {len(parcl) - len(parcl_matched_idx)}")
     logger.info(f"  Singularity unmatched: {len(sing) - len(sing_matched_idx)}")
 
@@ -198,86 +266,93 @@ def create_unified_sales(parcl: pd.DataFrame, sing: pd.DataFrame,
     """
     logger.info("Creating unified sales dataset...")
 
-    unified_records = []
-
-    # 1. Process matched records (best of both)
-    for _, match in matches.iterrows():
-        p_row = parcl.loc[match['parcl_idx']]
-        s_row = sing.loc[match['sing_idx']]
-
-        unified_records.append({
-            'sale_date': p_row['sale_date'],
-            'sale_price': p_row['sale_price'],  # Use Parcl (actual sale price)
-            'purchase_price': p_row['purchase_price'],
-            'purchase_date': p_row['purchase_date'],
-            'days_held': p_row['days_held'],
-            'realized_net': p_row['realized_net'],
-            'address': s_row.get('address', ''),
-            'city': s_row.get('city', ''),
-            'beds': s_row.get('beds', np.nan),
-            'baths': s_row.get('baths', np.nan),
-            'sqft': s_row.get('sqft', np.nan),
-            'property_id': p_row.get('property_id', ''),
-            'source': 'matched',
-            'has_pnl': not pd.isna(p_row['realized_net']),
-            'has_details': not pd.isna(s_row.get('beds')),
-        })
-
-    # 2. Process Singularity-only records
-    for s_idx, s_row in sing.iterrows():
-        if s_idx in sing_matched:
-            continue
+    def column(df: pd.DataFrame, name: str, default) -> np.ndarray:
+        """Column values, or ``default`` for every row if the source lacks it."""
+        if name in df.columns:
+            return df[name].to_numpy()
+        return np.full(len(df), default, dtype=object)
+
+    def parcl_fields(rows: pd.DataFrame) -> dict:
+        return {
+            'sale_date': rows['sale_date'].to_numpy(),
+            'sale_price': rows['sale_price'].to_numpy(),
+            'purchase_price': rows['purchase_price'].to_numpy(),
+            'purchase_date': rows['purchase_date'].to_numpy(),
+            'days_held': rows['days_held'].array,
+            'realized_net': rows['realized_net'].to_numpy(),
+        }
+
+    def sing_details(rows: pd.DataFrame) -> dict:
+        return {
+            'address': column(rows, 'address', ''),
+            'city': column(rows, 'city', ''),
+            'beds': column(rows, 'beds', np.nan),
+            'baths': column(rows, 'baths', np.nan),
+            'sqft': column(rows, 'sqft', np.nan),
+        }
+
+    # 1. Matched records (best of both): Parcl financials + Singularity details
+    p_rows = parcl.loc[matches['parcl_idx']] if len(matches) else parcl.iloc[:0]
+    s_rows = sing.loc[matches['sing_idx']] if len(matches) else sing.iloc[:0]
+    matched = pd.DataFrame({
+        **parcl_fields(p_rows),  # Use Parcl sale price (actual sale price)
+        **sing_details(s_rows),
+        'property_id': column(p_rows, 'property_id', ''),
+        'source': 'matched',
+        'has_pnl': p_rows['realized_net'].notna().to_numpy(),
+        'has_details': pd.notna(column(s_rows, 'beds', np.nan)),
+    })
 
-        unified_records.append({
-            'sale_date': s_row['sale_date'],
-            'sale_price': s_row['sale_price'],
-            'purchase_price': np.nan,
-            'purchase_date': pd.NaT,
-            'days_held': np.nan,
-            'realized_net': np.nan,
-            'address': s_row.get('address', ''),
-            'city': s_row.get('city', ''),
-            'beds': s_row.get('beds', np.nan),
-            'baths': s_row.get('baths', np.nan),
-            'sqft': s_row.get('sqft', np.nan),
-            'property_id': '',
-            'source': 'singularity_only',
-            'has_pnl': False,
-            'has_details': not pd.isna(s_row.get('beds')),
-        })
-
-    # 3. Process Parcl-only records
-    for p_idx, p_row in parcl.iterrows():
-        if p_idx in parcl_matched:
-            continue
+    # 2. Singularity-only records (no P&L)
+    s_only = sing[~sing.index.isin(sing_matched)]
+    singularity_only = pd.DataFrame({
+        'sale_date': s_only['sale_date'].to_numpy(),
+        'sale_price': s_only['sale_price'].to_numpy(),
+        'purchase_price': np.nan,
+        'purchase_date': pd.NaT,
+        'days_held': np.nan,
+        'realized_net': np.nan,
+        **sing_details(s_only),
+        'property_id': '',
+        'source': 'singularity_only',
+        'has_pnl': False,
+        'has_details': pd.notna(column(s_only, 'beds', np.nan)),
+    })
 
-        unified_records.append({
-            'sale_date': p_row['sale_date'],
-            'sale_price': p_row['sale_price'],
-            'purchase_price': p_row['purchase_price'],
-            'purchase_date': p_row['purchase_date'],
-            'days_held': p_row['days_held'],
-            'realized_net': p_row['realized_net'],
-            'address': '',
-            'city': '',
-            'beds': np.nan,
-            'baths': np.nan,
-            'sqft': np.nan,
-            'property_id': p_row.get('property_id', ''),
-            'source': 'parcl_only',
-            'has_pnl': not pd.isna(p_row['realized_net']),
-            'has_details': False,
-        })
-
-    unified = pd.DataFrame(unified_records)
-    unified = unified.sort_values('sale_date', ascending=False).reset_index(drop=True)
-
-    # Deduplicate by address + sale_date (keep first, which has most data due to sort)
+    # 3. Parcl-only records (no property details)
+    p_only = parcl[~parcl.index.isin(parcl_matched)]
+    parcl_only = pd.DataFrame({
+        **parcl_fields(p_only),
+        'address': '',
+        'city': '',
+        'beds': np.nan,
+        'baths': np.nan,
+        'sqft': np.nan,
+        'property_id': column(p_only, 'property_id', ''),
+        'source': 'parcl_only',
+        'has_pnl': p_only['realized_net'].notna().to_numpy(),
+        'has_details': False,
+    })
+
+    unified = pd.concat([matched, singularity_only, parcl_only], ignore_index=True)
+    unified = unified.astype(UNIFIED_SALES_DTYPES)
+
+    # Deduplicate by address + sale_date, keeping the row with the most data
+    # (P&L outranks details; ties go to the earlier source). One hash groupby
+    # picks the winners, then only the survivors are sorted newest first.
     before_dedup = len(unified)
-    unified = unified.drop_duplicates(subset=['address', 'sale_date'], keep='first')
-    unified = unified.reset_index(drop=True)
+    richness = pd.Series(
+        unified['has_pnl'].to_numpy(dtype=np.int8) * 2 + unified['has_details'].to_numpy(dtype=np.int8),
+        index=unified.index,
+    )
+    keep = richness.groupby([unified['address'], unified['sale_date']], sort=False, dropna=False).idxmax()
+    unified = unified.loc[keep.to_numpy()]
+    unified = unified.sort_values('sale_date', ascending=False, kind='stable').reset_index(drop=True)
     dedup_removed = before_dedup - len(unified)
 
+    # Three fixed labels: store as int8 category codes rather than strings
+    unified['source'] = pd.Categorical(unified['source'], categories=SALE_SOURCES)
+
     logger.info(f"  Unified dataset: {len(unified)} total sales")
     if dedup_removed > 0:
         logger.info(f"    - Removed {dedup_removed} duplicate records")
@@ -296,30 +371,28 @@ def create_unified_daily(sing_daily: pd.DataFrame, unified_sales: pd.DataFrame)
     logger.info("Creating unified daily timeseries...")
 
     # Start with Singularity daily (most complete)
-    daily = sing_daily.copy()
-    daily = daily.rename(columns={
+    daily = sing_daily.rename(columns={
         'sales_count': 'sales_count_sing',
         'revenue_millions': 'revenue_millions_sing',
     })
 
-    # Calculate daily metrics from unified sales
-    unified_sales['date'] = unified_sales['sale_date'].dt.date
-
-    # Daily aggregates
-    daily_agg = unified_sales.groupby('date').agg({
-        'sale_price': ['count', 'sum', 'mean'],
-        'realized_net': ['sum', 'mean', 'count'],
-        'has_pnl': 'sum',
-    }).reset_index()
-
-    daily_agg.columns = ['date', 'sales_count_unified', 'revenue_unified', 'avg_price',
-                          'total_realized', 'avg_realized', 'pnl_count', 'has_pnl_count']
-    daily_agg['date'] = pd.to_datetime(daily_agg['date'])
+    # Daily aggregates from unified sales, computed straight into their final
+    # names and keyed by day (unified_sales itself is left untouched)
+    sale_day = unified_sales['sale_date'].dt.floor('D')
+    daily_agg = unified_sales.groupby(sale_day).agg(
+        sales_count_unified=('sale_price', 'count'),
+        revenue_unified=('sale_price', 'sum'),
+        avg_price=('sale_price', 'mean'),
+        total_realized=('realized_net', 'sum'),
+        avg_realized=('realized_net', 'mean'),
+        pnl_count=('realized_net', 'count'),
+        has_pnl_count=('has_pnl', 'sum'),
+    )
     daily_agg['revenue_millions_unified'] = daily_agg['revenue_unified'] / 1_000_000
     daily_agg['pnl_coverage'] = daily_agg['has_pnl_count'] / daily_agg['sales_count_unified']
 
-    # Merge
-    daily = daily.merge(daily_agg, on='date', how='left')
+    # Join onto the Singularity days (left join keeps every Singularity day)
+    daily = daily.join(daily_agg, on='date')
 
     # Use Singularity counts as primary (more complete)
     daily['sales_count'] = daily['sales_count_sing']
@@ -335,24 +408,49 @@ def create_unified_daily(sing_daily: pd.DataFrame, unified_sales: pd.DataFrame)
     return daily
 
 
+def sales_since(unified_sales: pd.DataFrame, start_date: str) -> pd.DataFrame:
+    """
+    Rows of unified_sales with sale_date >= start_date.
+
+    unified_sales is sorted newest first, so the matching rows are a prefix
+    and a binary search finds the cut. Viewed as int64, NaT (sorted last) is
+    the smallest value, so it falls outside the cut as it would in a mask.
+    """
+    dates = unified_sales['sale_date'].to_numpy()
+    start = np.datetime64(start_date).astype(dates.dtype).astype(np.int64)
+    n_older = np.searchsorted(dates.view(np.int64)[::-1], start, side='left')
+    return unified_sales.iloc[:len(dates) - n_older]
+
+
 def calculate_summary_metrics(unified_sales: pd.DataFrame,
                               unified_daily: pd.DataFrame,
                               start_date: str = None) -> dict:
     """Calculate summary metrics for dashboard."""
 
+    # Read-only from here on, so no defensive copies
     if start_date:
-        sales = unified_sales[unified_sales['sale_date'] >= start_date].copy()
-        daily = unified_daily[unified_daily['date'] >= start_date].copy()
+        sales = sales_since(unified_sales, start_date)
+        daily = unified_daily[unified_daily['date'] >= start_date]
     else:
-        sales = unified_sales.copy()
-        daily = unified_daily.copy()
+        sales = unified_sales
+        daily = unified_daily
+
+    # One pass over source; every source subtotal derives from these counts
+    source_counts = sales['source'].value_counts()
+    n_sales = len(sales)
+    n_matched = int(source_counts.get('matched', 0))
+    n_sing_only = int(source_counts.get('singularity_only', 0))
+    n_parcl_only = int(source_counts.get('parcl_only', 0))
+    n_from_sing = n_sales - n_parcl_only
+    n_from_parcl = n_sales - n_sing_only
 
-    # Sales with P&L data
-    sales_with_pnl = sales[sales['has_pnl'] == True]
+    # Realized net of sales with P&L data, as a flat float array
+    pnl = sales['realized_net'].to_numpy(dtype=float)[sales['has_pnl'].to_numpy(dtype=bool)]
 
     # Win/loss
-    wins = sales_with_pnl[sales_with_pnl['realized_net'] > 0]
-    losses = sales_with_pnl[sales_with_pnl['realized_net'] < 0]
+    wins = pnl[pnl > 0]
+    losses = pnl[pnl < 0]
+    n_decided = len(wins) + len(losses)
 
     metrics = {
         'period': {
@@ -362,11 +460,11 @@ def calculate_summary_metrics(unified_sales: pd.DataFrame,
         },
         'sales': {
             'total': len(sales),
-            'from_singularity': (sales['source'] != 'parcl_only').sum(),
-            'from_parcl': (sales['source'] != 'singularity_only').sum(),
-            'matched': (sales['source'] == 'matched').sum(),
-            'singularity_only': (sales['source'] == 'singularity_only').sum(),
-            'parcl_only': (sales['source'] == 'parcl_only').sum(),
+            'from_singularity': n_from_sing,
+            'from_parcl': n_from_parcl,
+            'matched': n_matched,
+            'singularity_only': n_sing_only,
+            'parcl_only': n_parcl_only,
         },
         'revenue': {
             'total': sales['sale_price'].sum(),
@@ -380,24 +478,25 @@ def calculate_summary_metrics(unified_sales: pd.DataFrame,
             'best_day_count': int(daily['sales_count'].max()) if len(daily) > 0 else 0,
         },
         'pnl': {
-            'coverage_pct': len(sales_with_pnl) / len(sales) * 100 if len(sales) > 0 else 0,
-            'total_realized': sales_with_pnl['realized_net'].sum(),
-            'win_rate': len(wins) / (len(wins) + len(losses)) * 100 if (len(wins) + len(losses)) > 0 else 0,
-            'avg_profit': wins['realized_net'].mean() if len(wins) > 0 else 0,
-            'avg_loss': losses['realized_net'].mean() if len(losses) > 0 else 0,
+            'coverage_pct': len(pnl) / n_sales * 100 if n_sales > 0 else 0,
+            'total_realized': pnl.sum(),
+            'win_rate': len(wins) / n_decided * 100 if n_decided > 0 else 0,
+            'avg_profit': wins.mean() if len(wins) > 0 else 0,
+            'avg_loss': losses.mean() if len(losses) > 0 else 0,
             'wins': len(wins),
             'losses': len(losses),
         },
         'property_details': {
             'coverage_pct': sales['has_details'].sum() / len(sales) * 100 if len(sales) > 0 else 0,
-            'avg_beds': sales['beds'].mean(),
-            'avg_baths': sales['baths'].mean(),
-            'avg_sqft': sales['sqft'].mean(),
+            # float32 columns; mean() returns np.float32, which json.dump can't encode
+            'avg_beds': float(sales['beds'].mean()),
+            'avg_baths': float(sales['baths'].mean()),
+            'avg_sqft': float(sales['sqft'].mean()),
         },
         'data_quality': {
-            'singularity_pct': (sales['source'] != 'parcl_only').sum() / len(sales) * 100 if len(sales) > 0 else 0,
-            'parcl_pct': (sales['source'] != 'singularity_only').sum() / len(sales) * 100 if len(sales) > 0 else 0,
-            'full_data_pct': (sales['source'] == 'matched').sum() / len(sales) * 100 if len(sales) > 0 else 0,
+            'singularity_pct': n_from_sing / n_sales * 100 if n_sales > 0 else 0,
+            'parcl_pct': n_from_parcl / n_sales * 100 if n_sales > 0 else 0,
+            'full_data_pct': n_matched / n_sales * 100 if n_sales > 0 else 0,
         },
     }
 
@@ -433,6 +532,11 @@ def main():
         default=None,
         help="Path to Singularity daily CSV"
     )
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help="Also write unified sales/daily/matches as Parquet (requires pyarrow)"
+    )
     args = parser.parse_args()
 
     # Determine paths
@@ -470,9 +574,13 @@ def main():
     print("  MERGING OPENDOOR DATASETS")
     print("=" * 70)
 
-    # Load data
-    parcl_sales, parcl_listings = load_parcl_data(parcl_sales_path, parcl_listings_path)
-    sing_sales, sing_daily = load_singularity_data(sing_sales_path, sing_daily_path)
+    # Load data; the Parcl and Singularity files are independent and the C
+    # parser releases the GIL, so read both sources in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parcl_future = executor.submit(load_parcl_data, parcl_sales_path, parcl_listings_path)
+        sing_future = executor.submit(load_singularity_data, sing_sales_path, sing_daily_path)
+        parcl_sales, parcl_listings = parcl_future.result()
+        sing_sales, sing_daily = sing_future.result()
 
     # Match records
     matches, parcl_matched, sing_matched = match_records(parcl_sales, sing_sales)
@@ -500,8 +608,17 @@ def main():
 
     # Metrics JSON
     metrics_file = output_dir / f"unified_metrics_{timestamp}.json"
-    with open(metrics_file, 'w') as f:
-        json.dump({'q1_2026': q1_metrics, 'all_time': all_metrics}, f, indent=2, default=str)
+    metrics = {'q1_2026': q1_metrics, 'all_time': all_metrics}
+    if HAS_ORJSON:
+        # orjson encodes in C and handles numpy scalars natively
+        metrics_file.write_bytes(orjson.dumps(
+            metrics,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        ))
+    else:
+        with open(metrics_file, 'w') as f:
+            json.dump(metrics, f, indent=2, default=str)
     logger.info(f"Saved: {metrics_file}")
 
     # Also save match info for debugging
@@ -509,6 +626,18 @@ def main():
         matches_file = output_dir / f"dataset_matches_{timestamp}.csv"
         matches.to_csv(matches_file, index=False)
 
+    # Typed, compressed copies for analysis (CSV stays the dashboard input)
+    if args.parquet:
+        if HAS_PYARROW:
+            for name, df in (('unified_sales', unified_sales),
+                             ('unified_daily', unified_daily),
+                             ('dataset_matches', matches)):
+                parquet_file = output_dir / f"{name}_{timestamp}.parquet"
+                df.to_parquet(parquet_file, compression='snappy', index=False)
+                logger.info(f"Saved: {parquet_file}")
+        else:
+            logger.warning("pyarrow not installed, skipping Parquet output")
+
     # Print summary
     print("\n" + "=" * 70)
     print("  UNIFIED DATASET SUMMARY")
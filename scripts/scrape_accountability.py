@@ -10,138 +10,318 @@ This gives us:
 
 import json
 import re
+from collections import defaultdict
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+
+# Fast JSON serialization (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+URL = "https://accountable.opendoor.com/"
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+REQUEST_TIMEOUT = 30  # seconds
+Q1_START_WEEK = "2026-01-01"
+
+# Shared keep-alive session; requests already negotiates gzip/deflate (and br
+# when a brotli decoder is installed) via its default Accept-Encoding
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# Compiled once at import; every scrape reuses them against the full page HTML
+# Product entries: "Product Name" (MM/DD/YYYY)
+_PRODUCT_RE = re.compile(r'"([^"]{5,80})"\s*\((\d{1,2}/\d{1,2}/\d{4})\)')
+# Substrings marking a pattern 1 match as a code/JSON artifact, not a product
+_ARTIFACT_MARKERS = ('month', 'actual', 'high', 'low', '{', '}')
+# Embedded JSON product data: {"title":"...", "date":"...", ...}
+_JSON_PRODUCT_RE = re.compile(r'\{"title"\s*:\s*"([^"]+)"\s*,\s*"date"\s*:\s*"([^"]+)"')
+
+# Weekly contract data points. Strategies 1, 2 and 4 share one alternation
+# so a single pass over the HTML finds all three formats; the named group
+# that matched tells which strategy a data point belongs to.
+_WEEKLY_RE = re.compile(
+    # Strategy 1: direct JSON format (unescaped)
+    r'\{"month":"(?P<week1>\d{4}-\d{2}-\d{2})","actual":(?P<actual1>\d+),"high":\d+,"low":\d+,"lastYear":(?P<last_year1>\d+)\}'
+    # Strategy 2: unicode escaped quotes (common in Next.js hydration)
+    r'|\{\\u0022month\\u0022:\\u0022(?P<week2>\d{4}-\d{2}-\d{2})\\u0022,\\u0022actual\\u0022:(?P<actual2>\d+)'
+    # Strategy 4: escaped JSON format
+    r'|\\?"month\\?"\\?:\\?"(?P<week4>\d{4}-\d{2}-\d{2})\\?"\\?,\\?"actual\\?"\\?:(?P<actual4>\d+)'
+)
+# Strategy 3: month/actual pairs inside script blocks
+_SCRIPT_RE = re.compile(r'<script[^>]*>([^<]*"month"[^<]*)</script>', re.IGNORECASE)
+_SCRIPT_INNER_RE = re.compile(r'"month"\s*:\s*"(\d{4}-\d{2}-\d{2})"\s*,\s*"actual"\s*:\s*(\d+)')
+
+# Next.js page data: the weekly series as one JSON blob
+_NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+# Week keys must look like the regex strategies' captures (YYYY-MM-DD)
+_WEEK_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# WoW change shown on the page, e.g. color:#007f5f">+12%
+_WOW_DISPLAY_RE = re.compile(r'color:#007f5f">\+?(-?\d+)%')
+
+
+# Specific known products from the page: (name, date, category).
+# These are often in structured data or specific HTML patterns.
+KNOWN_PRODUCTS = [
+    ('End-to-End AI Home Scoping', '10/17/2025', 'AI & Automation'),
+    ('Universal Underwriting Ensembler', '9/25/2025', 'AI & Automation'),
+    ('Automating Title & Escrow', '10/15/2025', 'AI & Automation'),
+    ('In-House Vision Model', '12/12/2025', 'AI & Automation'),
+    ('Cash Plus Pricing Unblocked Nationwide', '9/30/2025', 'Faster Acquisitions'),
+    ('True Seller Model v2', '9/29/2025', 'Faster Acquisitions'),
+    ('New Homes Directory', '11/13/2025', 'Faster Acquisitions'),
+    ('Buyer Peace of Mind Guarantee', '10/1/2025', 'Buyer Experience'),
+    ('Revamped Mortgage Experience', '12/8/2025', 'Buyer Experience'),
+    ('USDC Payment Acceptance', '11/6/2025', 'Buyer Experience'),
+    ('100% Zip Coverage in Lower 48 States', '12/19/2025', 'Seller Experience'),
+    ('Market Expansion', '11/5/2025', 'Seller Experience'),
+    ('Opendoor Key App on iOS & Android', '9/15/2025', 'Agent & Partner'),
+    ('Cash Plus for ALL Agents', '10/14/2025', 'Agent & Partner'),
+]
+
+
+def _known_product_pattern(name: str) -> str:
+    """Partial match: first and last word of the name with no tag in between."""
+    words = name.split()
+    if len(words) > 1:
+        return re.escape(words[0]) + r'[^<]*' + re.escape(words[-1])
+    return re.escape(name)
+
+
+# (compiled pattern, name, date, category), built once at import
+_KNOWN_PRODUCTS = [
+    (re.compile(_known_product_pattern(name), re.IGNORECASE), name, date, category)
+    for name, date, category in KNOWN_PRODUCTS
+]
+
+
+# Product categories in priority order; a category applies when any of its
+# keywords appears anywhere in the lowercased name (plain substring match)
+_CATEGORY_KEYWORDS = [
+    (re.compile('|'.join(map(re.escape, keywords))), category)
+    for keywords, category in [
+        (['ai', 'model', 'vision', 'automat', 'ml', 'ensemble'], 'AI & Automation'),
+        (['buyer', 'mortgage', 'guarantee', 'usdc', 'payment'], 'Buyer Experience'),
+        (['seller', 'coverage', 'zip', 'market expansion'], 'Seller Experience'),
+        (['agent', 'partner', 'key app'], 'Agent & Partner'),
+        (['acquisition', 'pricing', 'underwriting', 'cash plus', 'true seller'], 'Faster Acquisitions'),
+        (['title', 'escrow', 'closing'], 'Operations'),
+    ]
+]
+
+
+@lru_cache(maxsize=256)
+def _parse_product_date(date_str: str) -> datetime:
+    """Parse an MM/DD/YYYY product date; unparseable dates sort last."""
+    try:
+        return datetime.strptime(date_str, '%m/%d/%Y')
+    except ValueError:
+        return datetime.min
+
 
 def extract_product_updates(html: str) -> list:
     """Extract product updates/features shipped from the accountability page."""
     products = []
+    seen_names = set()  # first occurrence of each name wins
 
-    # Categories we're looking for
-    categories = {
-        'ai': 'AI & Automation',
-        'acquisition': 'Faster Acquisitions',
-        'buyer': 'Buyer Experience',
-        'seller': 'Seller Experience',
-        'agent': 'Agent & Partner',
-        'operations': 'Operations'
-    }
+    # Dated entries live in the page body (including its embedded data), so
+    # patterns 1 and 2 start scanning there instead of at the top of <head>
+    body_start = max(html.find('<body'), 0)
 
     # Pattern 1: Look for product entries with dates in format MM/DD/YYYY or similar
     # Common patterns: "Product Name" (date) - description
-    product_pattern = r'"([^"]{5,80})"\s*\((\d{1,2}/\d{1,2}/\d{4})\)'
-    matches = re.findall(product_pattern, html)
-    for name, date in matches:
+    for match in _PRODUCT_RE.finditer(html, body_start):
+        name, date = match.groups()
         # Skip if it looks like a code/JSON artifact
-        if any(x in name.lower() for x in ['month', 'actual', 'high', 'low', '{', '}']):
+        name_lower = name.lower()
+        if any(x in name_lower for x in _ARTIFACT_MARKERS):
+            continue
+        name = name.strip()
+        if name in seen_names:
             continue
+        seen_names.add(name)
         products.append({
-            'name': name.strip(),
+            'name': name,
             'date': date,
             'category': categorize_product(name)
         })
 
     # Pattern 2: Look for JSON-style product data that might be embedded
     # Format: {"title":"...", "date":"...", ...}
-    json_pattern = r'\{"title"\s*:\s*"([^"]+)"\s*,\s*"date"\s*:\s*"([^"]+)"'
-    json_matches = re.findall(json_pattern, html)
-    for title, date in json_matches:
-        if title not in [p['name'] for p in products]:
+    for match in _JSON_PRODUCT_RE.finditer(html, body_start):
+        title, date = match.groups()
+        title = title.strip()
+        if title not in seen_names:
+            seen_names.add(title)
             products.append({
-                'name': title.strip(),
+                'name': title,
                 'date': date,
                 'category': categorize_product(title)
             })
 
-    # Pattern 3: Look for specific known product formats from the page
-    # These are often in structured data or specific HTML patterns
-    known_products = [
-        ('End-to-End AI Home Scoping', '10/17/2025', 'AI & Automation'),
-        ('Universal Underwriting Ensembler', '9/25/2025', 'AI & Automation'),
-        ('Automating Title & Escrow', '10/15/2025', 'AI & Automation'),
-        ('In-House Vision Model', '12/12/2025', 'AI & Automation'),
-        ('Cash Plus Pricing Unblocked Nationwide', '9/30/2025', 'Faster Acquisitions'),
-        ('True Seller Model v2', '9/29/2025', 'Faster Acquisitions'),
-        ('New Homes Directory', '11/13/2025', 'Faster Acquisitions'),
-        ('Buyer Peace of Mind Guarantee', '10/1/2025', 'Buyer Experience'),
-        ('Revamped Mortgage Experience', '12/8/2025', 'Buyer Experience'),
-        ('USDC Payment Acceptance', '11/6/2025', 'Buyer Experience'),
-        ('100% Zip Coverage in Lower 48 States', '12/19/2025', 'Seller Experience'),
-        ('Market Expansion', '11/5/2025', 'Seller Experience'),
-        ('Opendoor Key App on iOS & Android', '9/15/2025', 'Agent & Partner'),
-        ('Cash Plus for ALL Agents', '10/14/2025', 'Agent & Partner'),
-    ]
-
-    # Check if known products are mentioned in the HTML and add them
-    for name, date, category in known_products:
-        # Check if the product name appears in the HTML (case-insensitive partial match)
-        name_pattern = re.escape(name.split()[0]) + r'[^<]*' + re.escape(name.split()[-1]) if len(name.split()) > 1 else re.escape(name)
-        if re.search(name_pattern, html, re.IGNORECASE):
-            if name not in [p['name'] for p in products]:
+    # Pattern 3: Check if known products are mentioned in the HTML and add them
+    for name_re, name, date, category in _KNOWN_PRODUCTS:
+        if name_re.search(html):
+            if name not in seen_names:
+                seen_names.add(name)
                 products.append({
                     'name': name,
                     'date': date,
                     'category': category
                 })
 
-    # Remove duplicates and sort by date (newest first)
-    seen = set()
-    unique_products = []
-    for p in products:
-        if p['name'] not in seen:
-            seen.add(p['name'])
-            unique_products.append(p)
-
     # Sort by date (newest first)
-    def parse_date(date_str):
-        try:
-            return datetime.strptime(date_str, '%m/%d/%Y')
-        except:
-            return datetime.min
+    products.sort(key=lambda x: _parse_product_date(x['date']), reverse=True)
 
-    unique_products.sort(key=lambda x: parse_date(x['date']), reverse=True)
-
-    return unique_products
+    return products
 
 def categorize_product(name: str) -> str:
     """Categorize a product based on its name."""
     name_lower = name.lower()
 
-    if any(x in name_lower for x in ['ai', 'model', 'vision', 'automat', 'ml', 'ensemble']):
-        return 'AI & Automation'
-    elif any(x in name_lower for x in ['buyer', 'mortgage', 'guarantee', 'usdc', 'payment']):
-        return 'Buyer Experience'
-    elif any(x in name_lower for x in ['seller', 'coverage', 'zip', 'market expansion']):
-        return 'Seller Experience'
-    elif any(x in name_lower for x in ['agent', 'partner', 'key app']):
-        return 'Agent & Partner'
-    elif any(x in name_lower for x in ['acquisition', 'pricing', 'underwriting', 'cash plus', 'true seller']):
-        return 'Faster Acquisitions'
-    elif any(x in name_lower for x in ['title', 'escrow', 'closing']):
-        return 'Operations'
-    else:
-        return 'Other'
+    for keywords_re, category in _CATEGORY_KEYWORDS:
+        if keywords_re.search(name_lower):
+            return category
+    return 'Other'
+
+def _iter_month_records(node):
+    """Yield every dict in a parsed JSON tree that has 'month' and 'actual' keys."""
+    if isinstance(node, dict):
+        if 'month' in node and 'actual' in node:
+            yield node
+        for value in node.values():
+            yield from _iter_month_records(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _iter_month_records(item)
+
+
+def _extract_next_data(html: str) -> list:
+    """Extract (week, actual, last_year) tuples from the __NEXT_DATA__ script.
+
+    Returns an empty list when the page has no parseable __NEXT_DATA__ blob,
+    so callers can fall back to the regex strategies.
+    """
+    match = _NEXT_DATA_RE.search(html)
+    if not match:
+        return []
+    try:
+        data = json.loads(match.group(1))
+    except ValueError:
+        return []
+
+    records = []
+    for record in _iter_month_records(data):
+        week = record['month']
+        actual = record['actual']
+        last_year = record.get('lastYear')
+        if not isinstance(week, str) or not _WEEK_RE.fullmatch(week) or type(actual) is not int:
+            continue
+        records.append((week, actual, last_year if type(last_year) is int else 0))
+    return records
+
+
+def _regex_weekly_matches(html: str) -> list:
+    """Fallback extraction of (week, actual, last_year) tuples from raw HTML.
+
+    Strategies are tried in order and the first that finds any data points
+    wins. Strategies 1, 2 and 4 come from one combined pass; strategy 3 is
+    scoped to script bodies, so it keeps its own scan and only runs when
+    strategies 1 and 2 found nothing. Strategies 2-4 capture no last-year
+    value, so it is 0.
+    """
+    # Every strategy needs a month key; a substring test rules pages out
+    # far faster than entering the regex engine
+    if 'month' not in html:
+        return []
+
+    direct, unicode_escaped, escaped = [], [], []
+    for m in _WEEKLY_RE.finditer(html):
+        if m['week1']:
+            direct.append((m['week1'], m['actual1'], m['last_year1']))
+        elif m['week2']:
+            unicode_escaped.append((m['week2'], m['actual2'], 0))
+        else:
+            escaped.append((m['week4'], m['actual4'], 0))
+
+    if direct:
+        return direct
+    if unicode_escaped:
+        return unicode_escaped
+
+    in_scripts = []
+    if '"month"' in html:
+        in_scripts = [
+            (m[1], m[2], 0)
+            for script in _SCRIPT_RE.finditer(html)
+            for m in _SCRIPT_INNER_RE.finditer(script[1])
+        ]
+    return in_scripts or escaped
+
+
+def _collect_weeks(matches, weeks: dict) -> int:
+    """Add (week, actual, last_year) matches to `weeks`; return how many were seen.
+
+    Projection data (actual=0) is skipped so only real data is kept, and
+    a week already present keeps its first data point.
+    """
+    n_points = 0
+    for week, actual, last_year in matches:
+        n_points += 1
+        actual = int(actual)
+        if actual > 0 and week not in weeks:
+            weeks[week] = (actual, int(last_year))
+    return n_points
+
+
+def extract_weekly_contracts(html: str) -> list:
+    """Extract weekly acquisition contract data points, sorted by week."""
+    # Keyed by week: the first data point seen for a week wins
+    weeks = {}
+
+    # Parse the Next.js page data when present; the regex strategies are
+    # only a fallback for pages without a usable __NEXT_DATA__ blob
+    n_points = _collect_weeks(_extract_next_data(html), weeks)
+    if not n_points:
+        n_points = _collect_weeks(_regex_weekly_matches(html), weeks)
+
+    print(f"Found {n_points} data points")
+
+    return [
+        {'week': week, 'actual': weeks[week][0], 'last_year': weeks[week][1]}
+        for week in sorted(weeks)
+    ]
+
 
 def scrape_accountability():
     """Scrape acquisition data from Opendoor's accountability page."""
 
-    url = "https://accountable.opendoor.com/"
-
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
-
-    print(f"Fetching {url}...")
-    response = requests.get(url, headers=headers)
+    print(f"Fetching {URL}...")
+    response = _SESSION.get(URL, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
 
+    # Decode as UTF-8 unless the server declares a charset, so requests never
+    # falls back to Latin-1 or sniffs the whole body for an encoding
+    if 'charset' not in response.headers.get('Content-Type', '').lower():
+        response.encoding = 'utf-8'
     html = response.text
+    # Drop the response so its raw byte buffer is freed before the regex
+    # passes; only the decoded text is needed from here on
+    del response
 
     acquisition_data = {
         "scraped_at": datetime.now().isoformat(),
-        "source": url,
+        "source": URL,
         "weekly_contracts": [],
         "product_updates": [],
         "latest": {},
@@ -152,88 +332,43 @@ def scrape_accountability():
     acquisition_data['product_updates'] = extract_product_updates(html)
     print(f"Found {len(acquisition_data['product_updates'])} product updates")
 
-    # Try multiple extraction strategies
-    weekly_matches = []
-
-    # Strategy 1: Direct JSON format (unescaped)
-    weekly_pattern = r'\{"month":"(\d{4}-\d{2}-\d{2})","actual":(\d+),"high":\d+,"low":\d+,"lastYear":(\d+)\}'
-    weekly_matches = re.findall(weekly_pattern, html)
-
-    # Strategy 2: Unicode escaped quotes (common in Next.js hydration)
-    if not weekly_matches:
-        weekly_pattern_unicode = r'\{\\u0022month\\u0022:\\u0022(\d{4}-\d{2}-\d{2})\\u0022,\\u0022actual\\u0022:(\d+)'
-        weekly_matches = re.findall(weekly_pattern_unicode, html)
-        # Add placeholder for last_year since we're only capturing 2 groups
-        weekly_matches = [(m[0], m[1], '0') for m in weekly_matches]
-
-    # Strategy 3: Look for the JSON array in script tags
-    if not weekly_matches:
-        # Find data in __NEXT_DATA__ or similar script blocks
-        script_pattern = r'<script[^>]*>([^<]*"month"[^<]*)</script>'
-        script_matches = re.findall(script_pattern, html, re.IGNORECASE)
-        for script_content in script_matches:
-            # Try to extract month/actual pairs from script content
-            inner_pattern = r'"month"\s*:\s*"(\d{4}-\d{2}-\d{2})"\s*,\s*"actual"\s*:\s*(\d+)'
-            inner_matches = re.findall(inner_pattern, script_content)
-            weekly_matches.extend([(m[0], m[1], '0') for m in inner_matches])
-
-    # Strategy 4: Look for escaped JSON format
-    if not weekly_matches:
-        escaped_pattern = r'\\?"month\\?"\\?:\\?"(\d{4}-\d{2}-\d{2})\\?"\\?,\\?"actual\\?"\\?:(\d+)'
-        weekly_matches = re.findall(escaped_pattern, html)
-        weekly_matches = [(m[0], m[1], '0') for m in weekly_matches]
-
-    print(f"Found {len(weekly_matches)} data points")
-
-    for match in weekly_matches:
-        actual_val = int(match[1])
-        # Skip projection data (actual=0) - only keep real data
-        if actual_val > 0:
-            acquisition_data['weekly_contracts'].append({
-                'week': match[0],
-                'actual': actual_val,
-                'last_year': int(match[2])
-            })
-
-    # Sort by date
-    acquisition_data['weekly_contracts'].sort(key=lambda x: x['week'])
-
-    # Remove duplicates
-    seen = set()
-    unique = []
-    for item in acquisition_data['weekly_contracts']:
-        if item['week'] not in seen:
-            seen.add(item['week'])
-            unique.append(item)
-    acquisition_data['weekly_contracts'] = unique
+    acquisition_data['weekly_contracts'] = extract_weekly_contracts(html)
 
     # Get latest data
-    if acquisition_data['weekly_contracts']:
-        latest = acquisition_data['weekly_contracts'][-1]
+    weekly = acquisition_data['weekly_contracts']
+    if weekly:
+        latest = weekly[-1]
         acquisition_data['latest']['week'] = latest['week']
         acquisition_data['latest']['contracts'] = latest['actual']
         acquisition_data['latest']['last_year'] = latest['last_year']
 
         # Calculate WoW change
-        if len(acquisition_data['weekly_contracts']) >= 2:
-            current = acquisition_data['weekly_contracts'][-1]['actual']
-            previous = acquisition_data['weekly_contracts'][-2]['actual']
+        if len(weekly) >= 2:
+            current = latest['actual']
+            previous = weekly[-2]['actual']
             if previous > 0:
                 wow = ((current - previous) / previous) * 100
                 acquisition_data['latest']['wow_change'] = round(wow, 1)
 
-        # Calculate 4-week average
-        last_4 = acquisition_data['weekly_contracts'][-4:] if len(acquisition_data['weekly_contracts']) >= 4 else acquisition_data['weekly_contracts']
-        avg_4w = sum(w['actual'] for w in last_4) / len(last_4)
-        acquisition_data['latest']['avg_4w'] = round(avg_4w, 1)
-
-        # Calculate total Q1 contracts (from 2026-01-01)
-        q1_contracts = [w for w in acquisition_data['weekly_contracts'] if w['week'] >= '2026-01-01']
-        acquisition_data['latest']['q1_total'] = sum(w['actual'] for w in q1_contracts)
-        acquisition_data['latest']['q1_weeks'] = len(q1_contracts)
+        # One backward scan for the 4-week average and the Q1 total (from
+        # 2026-01-01); weeks are sorted, so it stops once both are covered
+        sum_4w = n_4w = q1_total = q1_weeks = 0
+        for w in reversed(weekly):
+            if n_4w < 4:
+                sum_4w += w['actual']
+                n_4w += 1
+            if w['week'] >= Q1_START_WEEK:
+                q1_total += w['actual']
+                q1_weeks += 1
+            elif n_4w == 4:
+                break
+
+        acquisition_data['latest']['avg_4w'] = round(sum_4w / n_4w, 1)
+        acquisition_data['latest']['q1_total'] = q1_total
+        acquisition_data['latest']['q1_weeks'] = q1_weeks
 
     # Also grab the +X% from the page directly as a sanity check
-    wow_match = re.search(r'color:#007f5f">\+?(-?\d+)%', html)
+    wow_match = _WOW_DISPLAY_RE.search(html)
     if wow_match:
         acquisition_data['latest']['wow_display'] = int(wow_match.group(1))
 
@@ -251,8 +386,11 @@ def main():
     timestamp = datetime.now().strftime("%Y-%m-%d")
     output_file = output_dir / f"accountability_{timestamp}.json"
 
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    if HAS_ORJSON:
+        output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(data, f, indent=2)
 
     print(f"\nSaved to: {output_file}")
 
@@ -278,12 +416,9 @@ def main():
         print("=" * 50)
 
         # Group by category
-        by_category = {}
+        by_category = defaultdict(list)
         for p in products:
-            cat = p.get('category', 'Other')
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(p)
+            by_category[p.get('category', 'Other')].append(p)
 
         for category, items in by_category.items():
             print(f"\n  {category} ({len(items)}):")
@@ -6,12 +6,19 @@ https://boards-api.greenhouse.io/v1/boards/opendoor/jobs
 Tracks hiring trends and provides AI-powered strategic insights.
 """
 
+import argparse
+import html
 import json
 import os
+import re
+import sys
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
 
 try:
     import anthropic
@@ -19,23 +26,152 @@ try:
 except ImportError:
     HAS_ANTHROPIC = False
 
-GREENHOUSE_API = "https://boards-api.greenhouse.io/v1/boards/opendoor/jobs"
-GREENHOUSE_API_FULL = "https://boards-api.greenhouse.io/v1/boards/opendoor/jobs?content=true"
-
-def scrape_careers():
-    """Fetch job listings from Greenhouse API with full content."""
+# Fast JSON parsing/serialization (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-        "Accept": "application/json",
-    }
+# HTTP/2 client (optional; http2=True needs the h2 extra)
+try:
+    import httpx
+    import h2  # noqa: F401
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
 
-    # Fetch with full content for AI analysis
-    print(f"Fetching {GREENHOUSE_API_FULL}...")
-    response = requests.get(GREENHOUSE_API_FULL, headers=headers)
+GREENHOUSE_API = "https://boards-api.greenhouse.io/v1/boards/opendoor/jobs"
+GREENHOUSE_API_FULL = "https://boards-api.greenhouse.io/v1/boards/opendoor/jobs?content=true"
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Accept": "application/json",
+    # The content=true payload is mostly HTML descriptions and compresses
+    # well; both clients decode gzip/deflate transparently (br is left out
+    # since it needs an optional brotli decoder)
+    "Accept-Encoding": "gzip, deflate",
+}
+REQUEST_TIMEOUT = 30  # seconds
+
+# Department mapping (normalize department names); checked in order,
+# the first keyword found in the title wins
+DEPT_MAPPING = (
+    ('sales', 'Sales & Customer Experience'),
+    ('customer', 'Sales & Customer Experience'),
+    ('experience', 'Sales & Customer Experience'),
+    ('engineering', 'Engineering & Technology'),
+    ('software', 'Engineering & Technology'),
+    ('data', 'Engineering & Technology'),
+    ('ai', 'Engineering & Technology'),
+    ('ml', 'Engineering & Technology'),
+    ('it', 'Engineering & Technology'),
+    ('research', 'Engineering & Technology'),
+    ('finance', 'Finance & Operations'),
+    ('accounting', 'Finance & Operations'),
+    ('audit', 'Finance & Operations'),
+    ('payroll', 'Finance & Operations'),
+    ('operations', 'Finance & Operations'),
+    ('portfolio', 'Finance & Operations'),
+    ('marketing', 'Marketing & Growth'),
+    ('growth', 'Marketing & Growth'),
+    ('brand', 'Marketing & Growth'),
+    ('design', 'Marketing & Growth'),
+    ('product', 'Product & Design'),
+    ('ux', 'Product & Design'),
+)
+
+# Every keyword the department rules look for, matched in a single scan per
+# title. The lookahead reports overlapping occurrences too; none of the
+# keywords is a prefix of another, so no hit is shadowed.
+_SPECIAL_KEYWORDS = ('manager', 'director', 'advisor', 'advocate',
+                     'partner', 'trade', 'listing partner', 'agent')
+_TITLE_KEYWORD_RE = re.compile('(?=(%s))' % '|'.join(
+    map(re.escape, dict.fromkeys([k for k, _ in DEPT_MAPPING] + list(_SPECIAL_KEYWORDS)))))
+
+# Role detection keywords (plain substring matches, case-insensitive)
+SENIOR_RE = re.compile(r'director|senior|manager|lead|head', re.I)
+AI_RE = re.compile(r'ai|ml|machine learning|data scientist|research', re.I)
+STRATEGIC_RE = re.compile(
+    r'director|head|vp|vice president|chief'
+    r'|senior|lead|principal|staff'
+    r'|ai|ml|machine learning|data scientist|research'
+    r'|strategy|analytics',
+    re.I,
+)
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Shared keep-alive client so follow-up requests to Greenhouse reuse the
+# same TLS connection; with httpx they multiplex over it via HTTP/2
+if HAS_HTTPX:
+    _CLIENT = httpx.Client(
+        http2=True,
+        headers=HEADERS,
+        timeout=REQUEST_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+else:
+    _CLIENT = requests.Session()
+    _CLIENT.headers.update(HEADERS)
+    _CLIENT.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+def classify_title(title):
+    """Classify a job title.
+
+    Returns (department, is_senior, is_ai); the department comes from the
+    first DEPT_MAPPING keyword found, adjusted by a few special cases.
+    """
+    # Determine department from title (first keyword in mapping order wins)
+    title_lower = title.lower()
+    found = {m.group(1) for m in _TITLE_KEYWORD_RE.finditer(title_lower)}
+    department = next(
+        (dept for keyword, dept in DEPT_MAPPING if keyword in found),
+        'Other')
+
+    # Special cases
+    if 'manager' in found and 'sales' not in found:
+        if 'finance' in found or 'audit' in found:
+            department = 'Finance & Operations'
+    if 'director' in found:
+        if 'sales' in found:
+            department = 'Sales & Customer Experience'
+        elif 'brand' in found or 'design' in found:
+            department = 'Marketing & Growth'
+    if 'advisor' in found or 'advocate' in found:
+        department = 'Sales & Customer Experience'
+    if 'partner' in found and 'trade' in found:
+        department = 'Operations'
+    if 'listing partner' in found or 'agent' in found:
+        department = 'Sales & Customer Experience'
+
+    # Key/senior and engineering/AI roles
+    is_senior = SENIOR_RE.search(title_lower) is not None
+    is_ai = AI_RE.search(title_lower) is not None
+
+    return department, is_senior, is_ai
+
+
+def scrape_careers(etags=None, fetch_content=True):
+    """Fetch job listings from Greenhouse API.
+
+    Job descriptions are only requested with fetch_content (they are large
+    and only used by the AI analysis). etags maps request URLs to the ETag
+    last seen for them; if the URL used has one the request is conditional
+    and None is returned when Greenhouse answers 304 Not Modified.
+    """
+
+    url = GREENHOUSE_API_FULL if fetch_content else GREENHOUSE_API
+    print(f"Fetching {url}...")
+    etag = (etags or {}).get(url)
+    headers = {"If-None-Match": etag} if etag else None
+    response = _CLIENT.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304:
+        print("Job board unchanged since last scrape (304 Not Modified)")
+        return None
     response.raise_for_status()
 
-    data = response.json()
+    data = orjson.loads(response.content) if HAS_ORJSON else response.json()
     jobs = data.get('jobs', [])
 
     print(f"Found {len(jobs)} open positions")
@@ -44,6 +180,8 @@ def scrape_careers():
     careers_data = {
         "scraped_at": datetime.now().isoformat(),
         "source": GREENHOUSE_API,
+        # Keyed by URL: the content=true variant has its own ETag
+        "etags": {url: response.headers["ETag"]} if "ETag" in response.headers else {},
         "total_jobs": len(jobs),
         "jobs": [],
         "by_department": {},
@@ -51,65 +189,29 @@ def scrape_careers():
         "summary": {}
     }
 
-    # Department mapping (normalize department names)
-    dept_mapping = {
-        'sales': 'Sales & Customer Experience',
-        'customer': 'Sales & Customer Experience',
-        'experience': 'Sales & Customer Experience',
-        'engineering': 'Engineering & Technology',
-        'software': 'Engineering & Technology',
-        'data': 'Engineering & Technology',
-        'ai': 'Engineering & Technology',
-        'ml': 'Engineering & Technology',
-        'it': 'Engineering & Technology',
-        'research': 'Engineering & Technology',
-        'finance': 'Finance & Operations',
-        'accounting': 'Finance & Operations',
-        'audit': 'Finance & Operations',
-        'payroll': 'Finance & Operations',
-        'operations': 'Finance & Operations',
-        'portfolio': 'Finance & Operations',
-        'marketing': 'Marketing & Growth',
-        'growth': 'Marketing & Growth',
-        'brand': 'Marketing & Growth',
-        'design': 'Marketing & Growth',
-        'product': 'Product & Design',
-        'ux': 'Product & Design',
-    }
-
+    # The summaries only need titles and locations, so the groupings keep
+    # those as plain tuples/strings rather than whole job entries
     by_dept = defaultdict(list)
     by_location = defaultdict(list)
+    dept_counts = defaultdict(int)
+    senior_roles_count = 0
+    ai_roles_count = 0
+
+    titles = [job.get('title', 'Unknown') for job in jobs]
+    classified = map(classify_title, titles)
 
-    for job in jobs:
+    for job, title, (department, is_senior, is_ai) in zip(jobs, titles, classified):
+        # One shared string object per department name
+        department = sys.intern(department)
         job_id = job.get('id')
-        title = job.get('title', 'Unknown')
         location = job.get('location', {}).get('name', 'Remote')
         updated_at = job.get('updated_at', '')
         absolute_url = job.get('absolute_url', '')
 
-        # Determine department from title
-        title_lower = title.lower()
-        department = 'Other'
-        for keyword, dept in dept_mapping.items():
-            if keyword in title_lower:
-                department = dept
-                break
-
-        # Special cases
-        if 'manager' in title_lower and 'sales' not in title_lower:
-            if 'finance' in title_lower or 'audit' in title_lower:
-                department = 'Finance & Operations'
-        if 'director' in title_lower:
-            if 'sales' in title_lower:
-                department = 'Sales & Customer Experience'
-            elif 'brand' in title_lower or 'design' in title_lower:
-                department = 'Marketing & Growth'
-        if 'advisor' in title_lower or 'advocate' in title_lower:
-            department = 'Sales & Customer Experience'
-        if 'partner' in title_lower and 'trade' in title_lower:
-            department = 'Operations'
-        if 'listing partner' in title_lower or 'agent' in title_lower:
-            department = 'Sales & Customer Experience'
+        # Running counts for the summary, accumulated as jobs are classified
+        dept_counts[department] += 1
+        senior_roles_count += is_senior
+        ai_roles_count += is_ai
 
         # Get content/description if available
         content = job.get('content', '')
@@ -121,46 +223,38 @@ def scrape_careers():
             'location': location,
             'url': absolute_url,
             'updated_at': updated_at,
-            'content': content[:2000] if content else ''  # Truncate for storage
+            'content': content[:2000] if content else ''  # For the AI analysis; not saved
         }
 
         careers_data['jobs'].append(job_entry)
-        by_dept[department].append(job_entry)
+        by_dept[department].append((title, location))
 
         # Parse location for grouping
         loc_parts = location.split(';')
         for loc in loc_parts:
             loc = loc.strip()
             if loc:
-                by_location[loc].append(job_entry)
+                by_location[loc].append(title)
 
     # Build department summary
     for dept, dept_jobs in sorted(by_dept.items(), key=lambda x: -len(x[1])):
         careers_data['by_department'][dept] = {
             'count': len(dept_jobs),
-            'jobs': [{'title': j['title'], 'location': j['location']} for j in dept_jobs]
+            'jobs': [{'title': t, 'location': l} for t, l in dept_jobs]
         }
 
-    # Build location summary
-    for loc, loc_jobs in sorted(by_location.items(), key=lambda x: -len(x[1])):
+    # Build location summary (sorted once; the top 5 are reused below)
+    sorted_locations = sorted(by_location.items(), key=lambda x: -len(x[1]))
+    for loc, loc_titles in sorted_locations:
         careers_data['by_location'][loc] = {
-            'count': len(loc_jobs),
-            'titles': [j['title'] for j in loc_jobs[:5]]  # Top 5 titles per location
+            'count': len(loc_titles),
+            'titles': loc_titles[:5]  # Top 5 titles per location
         }
 
     # Generate summary
-    dept_counts = {dept: len(jobs) for dept, jobs in by_dept.items()}
     top_dept = max(dept_counts, key=dept_counts.get) if dept_counts else 'Unknown'
 
-    top_locations = sorted(by_location.items(), key=lambda x: -len(x[1]))[:5]
-
-    # Identify key/senior roles
-    senior_roles = [j for j in careers_data['jobs']
-                    if any(x in j['title'].lower() for x in ['director', 'senior', 'manager', 'lead', 'head'])]
-
-    # Identify engineering/AI roles specifically
-    ai_roles = [j for j in careers_data['jobs']
-                if any(x in j['title'].lower() for x in ['ai', 'ml', 'machine learning', 'data scientist', 'research'])]
+    top_locations = sorted_locations[:5]
 
     careers_data['summary'] = {
         'total_positions': len(jobs),
@@ -168,8 +262,8 @@ def scrape_careers():
         'locations': len(by_location),
         'top_department': top_dept,
         'top_department_count': dept_counts.get(top_dept, 0),
-        'senior_roles_count': len(senior_roles),
-        'ai_ml_roles_count': len(ai_roles),
+        'senior_roles_count': senior_roles_count,
+        'ai_ml_roles_count': ai_roles_count,
         'top_locations': [{'name': loc, 'count': len(jobs)} for loc, jobs in top_locations],
         'hiring_signal': categorize_hiring(len(jobs), dept_counts)
     }
@@ -177,8 +271,52 @@ def scrape_careers():
     return careers_data
 
 
-def analyze_careers_with_ai(careers_data):
-    """Use Claude to extract strategic insights from job listings."""
+def compress_description(text):
+    """Reduce a Greenhouse job description to its plain text.
+
+    The API returns HTML-escaped markup; unescape it, drop the tags, then
+    unescape the entities inside the markup (&amp;, &nbsp;, ...) and
+    collapse whitespace so the prompt spends tokens on the words only.
+    """
+    text = _HTML_TAG_RE.sub(' ', html.unescape(text))
+    return _WHITESPACE_RE.sub(' ', html.unescape(text)).strip()
+
+
+# Static instructions for the careers analysis; sent as the system prompt,
+# with the job listings following in the user message
+CAREERS_ANALYSIS_INSTRUCTIONS = """Analyze these Opendoor job listings and extract ONLY material strategic insights for shareholders/investors.
+
+DO NOT include:
+- Basic headcount numbers
+- Generic observations like "they're hiring engineers"
+- Obvious statements
+
+DO extract specific insights like:
+- Leadership hires that signal strategic shifts (e.g., "Hiring Head of AI Pricing suggests investment in algorithmic pricing")
+- Specific AI/ML capabilities being built (what KIND of AI work based on job requirements)
+- New market or product initiatives (based on new role types)
+- Compensation competitiveness signals if mentioned
+- Technology stack changes (specific technologies mentioned)
+- Organizational changes (new teams being formed)
+
+Format: Return 3-5 bullet points, each one sentence, focused on MATERIAL insights only. Start each with a clear signal/implication.
+
+Return JSON format:
+{"insights": ["insight 1", "insight 2", ...]}"""
+
+
+@lru_cache(maxsize=None)
+def _get_anthropic_client(api_key):
+    """Return a shared Anthropic client so repeat calls reuse its connection pool."""
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def analyze_careers_with_ai(careers_data, batch=False):
+    """Use Claude to extract strategic insights from job listings.
+
+    With batch=True the request goes through the Message Batches API
+    (half price, asynchronous) and this call polls until it finishes.
+    """
 
     if not HAS_ANTHROPIC:
         print("Anthropic library not available, skipping AI analysis")
@@ -192,20 +330,14 @@ def analyze_careers_with_ai(careers_data):
     # Prepare job data for analysis - focus on senior/strategic roles
     strategic_jobs = []
     for job in careers_data.get('jobs', []):
-        title_lower = job['title'].lower()
         # Include leadership, AI/ML, and other strategic roles
-        is_strategic = any(x in title_lower for x in [
-            'director', 'head', 'vp', 'vice president', 'chief',
-            'senior', 'lead', 'principal', 'staff',
-            'ai', 'ml', 'machine learning', 'data scientist', 'research',
-            'strategy', 'analytics'
-        ])
+        is_strategic = STRATEGIC_RE.search(job['title']) is not None
         if is_strategic and job.get('content'):
             strategic_jobs.append({
                 'title': job['title'],
                 'department': job['department'],
                 'location': job['location'],
-                'description': job['content'][:1500]  # Keep descriptions focused
+                'description': compress_description(job['content'])[:1500]  # Keep descriptions focused
             })
 
     if not strategic_jobs:
@@ -217,43 +349,28 @@ def analyze_careers_with_ai(careers_data):
     for job in strategic_jobs[:20]:  # Limit to top 20 to manage token usage
         jobs_text += f"\n---\nTITLE: {job['title']}\nDEPT: {job['department']}\nLOCATION: {job['location']}\nDESCRIPTION:\n{job['description']}\n"
 
-    prompt = f"""Analyze these Opendoor job listings and extract ONLY material strategic insights for shareholders/investors.
-
-DO NOT include:
-- Basic headcount numbers
-- Generic observations like "they're hiring engineers"
-- Obvious statements
-
-DO extract specific insights like:
-- Leadership hires that signal strategic shifts (e.g., "Hiring Head of AI Pricing suggests investment in algorithmic pricing")
-- Specific AI/ML capabilities being built (what KIND of AI work based on job requirements)
-- New market or product initiatives (based on new role types)
-- Compensation competitiveness signals if mentioned
-- Technology stack changes (specific technologies mentioned)
-- Organizational changes (new teams being formed)
-
-Format: Return 3-5 bullet points, each one sentence, focused on MATERIAL insights only. Start each with a clear signal/implication.
-
-JOB LISTINGS:
-{jobs_text}
-
-Return JSON format:
-{{"insights": ["insight 1", "insight 2", ...]}}"""
+    prompt = f"JOB LISTINGS:\n{jobs_text}"
 
     try:
-        client = anthropic.Anthropic(api_key=api_key)
+        client = _get_anthropic_client(api_key)
         print("Analyzing job listings with Claude...")
 
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1000,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        params = {
+            "model": "claude-sonnet-4-20250514",
+            "max_tokens": 1000,
+            "system": CAREERS_ANALYSIS_INSTRUCTIONS,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if batch:
+            response = run_message_batch(client, params)
+            if response is None:
+                return None
+        else:
+            response = client.messages.create(**params)
 
         response_text = response.content[0].text.strip()
 
         # Parse JSON from response
-        import re
         json_match = re.search(r'\{[\s\S]*\}', response_text)
         if json_match:
             result = json.loads(json_match.group())
@@ -269,6 +386,34 @@ Return JSON format:
         return None
 
 
+def run_message_batch(client, params, poll_interval=10, max_interval=300):
+    """Submit one request through the Message Batches API and wait for it.
+
+    Returns the resulting message, or None if the request did not succeed.
+    """
+    custom_id = f"careers-{datetime.now().strftime('%Y-%m-%d')}"
+    message_batch = client.messages.batches.create(
+        requests=[{"custom_id": custom_id, "params": params}]
+    )
+    print(f"Submitted message batch {message_batch.id}, waiting for results...")
+
+    # Batches usually finish within minutes but may take hours; back off
+    while message_batch.processing_status != "ended":
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, max_interval)
+        message_batch = client.messages.batches.retrieve(message_batch.id)
+
+    for entry in client.messages.batches.results(message_batch.id):
+        if entry.custom_id == custom_id:
+            if entry.result.type == "succeeded":
+                return entry.result.message
+            print(f"Message batch request {entry.result.type}")
+            return None
+
+    print("Message batch returned no result")
+    return None
+
+
 def categorize_hiring(total_jobs, dept_counts):
     """Categorize hiring activity level and focus."""
 
@@ -302,26 +447,102 @@ def categorize_hiring(total_jobs, dept_counts):
     }
 
 
+def load_careers_file(path):
+    """Load a previously saved careers JSON file."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_careers_file(data, path, pretty=False):
+    """Write careers data as JSON, streaming the jobs list.
+
+    Output is compact unless pretty is set, in which case the summaries are
+    indented and each job goes on its own line. Job descriptions ('content')
+    are only needed for the AI analysis and are left out of the file;
+    nothing downstream reads them.
+    """
+    if HAS_ORJSON:
+        def dumps(obj, indent=False):
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        def dumps(obj, indent=False):
+            return json.dumps(obj, indent=2 if indent else None,
+                              separators=None if indent else (',', ':')).encode()
+
+    # Line break + indentation before top-level keys and before each job
+    pad, job_pad = (b'\n  ', b'\n    ') if pretty else (b'', b'')
+
+    with open(path, 'wb') as f:
+        f.write(b'{')
+        for i, (key, value) in enumerate(data.items()):
+            f.write((b',' if i else b'') + pad)
+            f.write(dumps(key) + (b': ' if pretty else b':'))
+            if key == 'jobs':
+                f.write(b'[')
+                for j, job in enumerate(value):
+                    f.write((b',' if j else b'') + job_pad)
+                    f.write(dumps({k: v for k, v in job.items() if k != 'content'}))
+                f.write((pad if value else b'') + b']')
+            else:
+                encoded = dumps(value, indent=pretty)
+                f.write(encoded.replace(b'\n', pad) if pretty else encoded)
+        f.write(b'\n}' if pretty else b'}')
+
+
 def main():
+    parser = argparse.ArgumentParser(
+        description="Scrape Opendoor careers data and summarize hiring signals"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Run the AI analysis through the Message Batches API (cheaper, slower)"
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented JSON instead of compact output"
+    )
+    args = parser.parse_args()
+
     output_dir = Path(__file__).parent.parent / "outputs"
     output_dir.mkdir(exist_ok=True)
 
+    # The latest saved scrape carries the ETag it was fetched with, so an
+    # unchanged job board can skip parsing and the AI analysis entirely
+    previous_files = sorted(output_dir.glob("careers_*.json"))
+    previous = load_careers_file(previous_files[-1]) if previous_files else {}
+
+    # Descriptions are only worth downloading if the AI analysis will run
+    fetch_content = HAS_ANTHROPIC and bool(os.environ.get('ANTHROPIC_API_KEY'))
+
+    # Reusing the previous scrape would also reuse its (missing) insights,
+    # so fetch unconditionally when AI is on but the last run had none
+    etags = previous.get('etags')
+    if fetch_content and not previous.get('ai_insights'):
+        etags = None
+
     print("Scraping Opendoor careers...")
-    data = scrape_careers()
+    data = scrape_careers(etags=etags, fetch_content=fetch_content)
 
-    # Run AI analysis for strategic insights
-    ai_insights = analyze_careers_with_ai(data)
-    if ai_insights:
-        data['ai_insights'] = ai_insights
+    if data is None:
+        # Re-save under today's date; the dashboard only looks back a week
+        data = previous
     else:
-        data['ai_insights'] = []
+        # Run AI analysis for strategic insights
+        ai_insights = analyze_careers_with_ai(data, batch=args.batch)
+        if ai_insights:
+            data['ai_insights'] = ai_insights
+        else:
+            data['ai_insights'] = []
 
     # Save data
     timestamp = datetime.now().strftime("%Y-%m-%d")
     output_file = output_dir / f"careers_{timestamp}.json"
 
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_careers_file(data, output_file, pretty=args.pretty)
 
     print(f"\nSaved to: {output_file}")
 
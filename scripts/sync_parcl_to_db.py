@@ -3,13 +3,14 @@
 Sync Parcl CSV sales data to the glasshouse.db sales_log table.
 
 This script imports records from Parcl Labs CSV exports that are not
-already in the database. It handles deduplication by checking for
-existing records by property_id and sale_date.
+already in the database. Deduplication on property_id and sale_date is
+enforced by a UNIQUE index on sales_log where possible.
 
 Usage:
     python scripts/sync_parcl_to_db.py
     python scripts/sync_parcl_to_db.py --dry-run
     python scripts/sync_parcl_to_db.py --csv /path/to/specific.csv
+    python scripts/sync_parcl_to_db.py --force   # re-sync an already imported CSV
 """
 
 import sys
@@ -18,12 +19,14 @@ import glob
 import sqlite3
 import logging
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pandas as pd
 
+from src.db.database import Database, apply_bulk_pragmas
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +39,38 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DB_PATH = PROJECT_ROOT / "data" / "glasshouse.db"
 PARCL_CSV_PATTERN = Path.home() / "Desktop" / "glasshouse" / "opendoor-home-sales-*.csv"
 
+# Parcl CSV columns read by load_parcl_csv, in unpacking order
+CSV_COLUMNS = [
+    'property_id', 'sale_date', 'sale_price', 'purchase_date', 'purchase_price',
+    'days_held', 'realized_net', 'quarter', 'year',
+]
+
+# Rows parsed per pd.read_csv chunk
+CSV_CHUNK_SIZE = 50_000
+
+# Columns read as strings: dtype inference runs per chunk, so a chunk with a
+# blank property_id would otherwise turn IDs into floats ('123.0')
+CSV_STR_COLUMNS = {'property_id', 'sale_date', 'purchase_date', 'quarter'}
+
+# Parsed record columns consumed by sync_to_database, in unpacking order
+RECORD_COLUMNS = [
+    'property_id', 'sale_date', 'sale_price', 'purchase_price', 'purchase_date',
+    'days_held', 'realized_net', 'quarter', 'year', 'source', 'imported_at',
+]
+
+INSERT_SALE_SQL = """
+    INSERT INTO sales_log (
+        property_id, sale_date, address, city, state,
+        sale_price, purchase_price, purchase_date,
+        days_held, realized_net, quarter, year,
+        source, imported_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT DO NOTHING
+"""
+
+# Rows buffered per executemany call
+INSERT_BATCH_SIZE = 5000
+
 
 def find_latest_parcl_csv() -> Path:
     """Find the most recent Parcl sales CSV file."""
@@ -58,18 +93,28 @@ def parse_date(date_str: str) -> str:
     if pd.isna(date_str) or not date_str:
         return None
 
+    value = str(date_str).strip()
     try:
-        # Handle format like "Jan 29, 2026"
-        dt = datetime.strptime(str(date_str).strip(), "%b %d, %Y")
-        return dt.strftime("%Y-%m-%d")
+        # Dispatch on shape so each value gets at most one parse attempt
+        if len(value) == 10 and value[4] == '-' and value[7] == '-':
+            # Already zero-padded ISO; fromisoformat just validates it
+            try:
+                return date.fromisoformat(value).isoformat()
+            except ValueError:
+                pass
+        if '-' in value:
+            # ISO without zero padding, e.g. "2026-1-5"
+            return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+        if ',' in value:
+            # Handle format like "Jan 29, 2026"
+            return datetime.strptime(value, "%b %d, %Y").strftime("%Y-%m-%d")
+        if '/' in value:
+            return datetime.strptime(value, "%m/%d/%Y").strftime("%Y-%m-%d")
     except ValueError:
-        # Try ISO format if already in that format
-        try:
-            dt = datetime.strptime(str(date_str).strip(), "%Y-%m-%d")
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            logger.warning(f"Could not parse date: {date_str}")
-            return None
+        pass
+
+    logger.warning(f"Could not parse date: {date_str}")
+    return None
 
 
 def parse_currency(value) -> float:
@@ -90,40 +135,64 @@ def parse_currency(value) -> float:
         return None
 
 
-def load_parcl_csv(csv_path: Path) -> pd.DataFrame:
-    """Load and parse Parcl CSV file."""
-    logger.info(f"Loading CSV: {csv_path}")
+def _standard_column(name: str) -> str:
+    """Standardize a CSV header to lowercase with underscores."""
+    return name.lower().replace(' ', '_')
+
 
-    df = pd.read_csv(csv_path)
-    logger.info(f"Loaded {len(df)} rows from CSV")
-    logger.info(f"Columns: {list(df.columns)}")
+def load_parcl_csv(csv_path: Path) -> pd.DataFrame:
+    """Load and parse Parcl CSV file.
 
-    # Standardize column names to lowercase with underscores
-    df.columns = [c.lower().replace(' ', '_') for c in df.columns]
+    Only the columns in CSV_COLUMNS are read, in chunks of CSV_CHUNK_SIZE rows,
+    so large historical exports are never held in memory as one raw frame.
+    """
+    logger.info(f"Loading CSV: {csv_path}")
 
-    # Parse and transform data
+    imported_at = datetime.now().isoformat()  # one timestamp for the whole import
     records = []
-    for _, row in df.iterrows():
-        record = {
-            'property_id': str(row.get('property_id', '')).strip() if pd.notna(row.get('property_id')) else None,
-            'sale_date': parse_date(row.get('sale_date')),
-            'sale_price': parse_currency(row.get('sale_price')),
-            'purchase_date': parse_date(row.get('purchase_date')),
-            'purchase_price': parse_currency(row.get('purchase_price')),
-            'days_held': int(row.get('days_held')) if pd.notna(row.get('days_held')) else None,
-            'realized_net': parse_currency(row.get('realized_net')),
-            'quarter': str(row.get('quarter', '')).strip() if pd.notna(row.get('quarter')) else None,
-            'year': int(row.get('year')) if pd.notna(row.get('year')) else None,
-            'source': 'parcl_csv',
-            'imported_at': datetime.now().isoformat(),
-        }
+    total_rows = 0
+
+    header = pd.read_csv(csv_path, nrows=0).columns
+    reader = pd.read_csv(
+        csv_path,
+        usecols=lambda c: _standard_column(c) in CSV_COLUMNS,
+        dtype={c: str for c in header if _standard_column(c) in CSV_STR_COLUMNS},
+        chunksize=CSV_CHUNK_SIZE,
+    )
+    for chunk in reader:
+        if not total_rows:
+            logger.info(f"Columns: {list(chunk.columns)}")
+        total_rows += len(chunk)
+
+        chunk.columns = [_standard_column(c) for c in chunk.columns]
+
+        # Parse and transform data. Iterate plain tuples over a fixed column
+        # order (missing columns become NaN) instead of building a Series per row.
+        source_cols = chunk.reindex(columns=CSV_COLUMNS)
+        for (property_id, sale_date, sale_price, purchase_date, purchase_price,
+             days_held, realized_net, quarter, year) in source_cols.itertuples(index=False, name=None):
+            record = {
+                'property_id': str(property_id).strip() if pd.notna(property_id) else None,
+                'sale_date': parse_date(sale_date),
+                'sale_price': parse_currency(sale_price),
+                'purchase_date': parse_date(purchase_date),
+                'purchase_price': parse_currency(purchase_price),
+                'days_held': int(days_held) if pd.notna(days_held) else None,
+                'realized_net': parse_currency(realized_net),
+                'quarter': str(quarter).strip() if pd.notna(quarter) else None,
+                'year': int(year) if pd.notna(year) else None,
+                'source': 'parcl_csv',
+                'imported_at': imported_at,
+            }
+
+            # Skip records without essential data
+            if not record['property_id'] or not record['sale_date']:
+                logger.debug(f"Skipping record with missing property_id or sale_date: {property_id}, {sale_date}")
+                continue
 
-        # Skip records without essential data
-        if not record['property_id'] or not record['sale_date']:
-            logger.debug(f"Skipping record with missing property_id or sale_date: {row.to_dict()}")
-            continue
+            records.append(record)
 
-        records.append(record)
+    logger.info(f"Loaded {total_rows} rows from CSV")
 
     result_df = pd.DataFrame(records)
     logger.info(f"Parsed {len(result_df)} valid records from CSV")
@@ -140,8 +209,7 @@ def get_address_mapping(conn: sqlite3.Connection) -> dict:
     """)
 
     mapping = {}
-    for row in cursor.fetchall():
-        property_id, address, city, state = row
+    for property_id, address, city, state in cursor:
         mapping[str(property_id)] = {
             'address': address,
             'city': city,
@@ -163,16 +231,80 @@ def get_existing_records(conn: sqlite3.Connection) -> set:
         WHERE property_id IS NOT NULL AND property_id != ''
     """)
 
-    existing = set()
-    for row in cursor.fetchall():
-        property_id, sale_date = row
-        if property_id and sale_date:
-            existing.add((str(property_id), sale_date))
+    # Stream rows straight into the set rather than materializing fetchall()
+    existing = {
+        (str(property_id), sale_date)
+        for property_id, sale_date in cursor
+        if property_id and sale_date
+    }
 
     logger.info(f"Found {len(existing)} existing records with property_id in database")
     return existing
 
 
+def insert_batch(cursor: sqlite3.Cursor, rows: list, stats: dict) -> None:
+    """Insert buffered sales_log rows with a single executemany.
+
+    Rows that collide with an existing (sale_date, address) are dropped by
+    ON CONFLICT DO NOTHING and counted as skipped. Any other error rolls the
+    batch back to its savepoint and replays it row by row so only the
+    offending rows are lost.
+    """
+    cursor.execute("SAVEPOINT insert_batch")
+    try:
+        cursor.executemany(INSERT_SALE_SQL, rows)
+        stats['added'] += cursor.rowcount
+        stats['skipped'] += len(rows) - cursor.rowcount
+    except sqlite3.Error:
+        cursor.execute("ROLLBACK TO insert_batch")
+        for row in rows:
+            try:
+                cursor.execute(INSERT_SALE_SQL, row)
+            except Exception as e:
+                logger.error(f"Error inserting record {row[0]}: {e}")
+                stats['errors'] += 1
+                continue
+            if cursor.rowcount:
+                stats['added'] += 1
+            else:
+                # Unique constraint (sale_date, address) already present
+                stats['skipped'] += 1
+    cursor.execute("RELEASE insert_batch")
+
+
+def has_sale_key_index(conn: sqlite3.Connection) -> bool:
+    """Check for the UNIQUE (property_id, sale_date) index from Database._init_schema."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'ux_sales_property_date'"
+    ).fetchone()
+    return row is not None
+
+
+def is_already_imported(conn: sqlite3.Connection, csv_path: Path) -> bool:
+    """Check whether this exact CSV (same path, mtime, size) was already synced."""
+    st = csv_path.stat()
+    row = conn.execute(
+        "SELECT mtime, size FROM import_manifest WHERE path = ?",
+        (str(csv_path.resolve()),)
+    ).fetchone()
+    return row is not None and row[0] == st.st_mtime and row[1] == st.st_size
+
+
+def record_import(conn: sqlite3.Connection, csv_path: Path, rows: int) -> None:
+    """Record a successfully synced CSV in the import manifest."""
+    st = csv_path.stat()
+    conn.execute("""
+        INSERT INTO import_manifest (path, mtime, size, rows, imported_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(path) DO UPDATE SET
+            mtime = excluded.mtime,
+            size = excluded.size,
+            rows = excluded.rows,
+            imported_at = excluded.imported_at
+    """, (str(csv_path.resolve()), st.st_mtime, st.st_size, rows, datetime.now().isoformat()))
+    conn.commit()
+
+
 def sync_to_database(df: pd.DataFrame, dry_run: bool = False) -> dict:
     """
     Sync DataFrame to sales_log table.
@@ -184,20 +316,33 @@ def sync_to_database(df: pd.DataFrame, dry_run: bool = False) -> dict:
     conn = sqlite3.connect(str(DB_PATH))
 
     try:
-        # Get existing records and address mapping
-        existing = get_existing_records(conn)
+        # Hold the write lock for the whole sync so the dedup snapshot stays valid
+        if not dry_run:
+            apply_bulk_pragmas(conn, wal=False)
+            conn.execute("BEGIN IMMEDIATE")
+
+        # With the UNIQUE index, SQLite drops rows already in the table via
+        # ON CONFLICT DO NOTHING; otherwise preload existing keys to dedupe here
+        if not dry_run and has_sale_key_index(conn):
+            existing = set()
+        else:
+            existing = get_existing_records(conn)
         address_mapping = get_address_mapping(conn)
 
         cursor = conn.cursor()
+        pending_inserts = []
 
-        for _, row in df.iterrows():
-            property_id = row['property_id']
-            sale_date = row['sale_date']
+        # Fixed column order lets each row be unpacked from a plain tuple
+        rows = df.reindex(columns=RECORD_COLUMNS).itertuples(index=False, name=None)
+        for (property_id, sale_date, sale_price, purchase_price, purchase_date,
+             days_held, realized_net, quarter, year, source, imported_at) in rows:
 
-            # Check for duplicate by property_id + sale_date
-            if (property_id, sale_date) in existing:
+            # Check for duplicate by property_id + sale_date (preloaded or earlier in this CSV)
+            key = (property_id, sale_date)
+            if key in existing:
                 stats['skipped'] += 1
                 continue
+            existing.add(key)
 
             # Look up address from property_daily_snapshot
             address_info = address_mapping.get(property_id, {})
@@ -207,45 +352,33 @@ def sync_to_database(df: pd.DataFrame, dry_run: bool = False) -> dict:
 
             if dry_run:
                 logger.info(f"Would add: property_id={property_id}, sale_date={sale_date}, "
-                           f"address={address}, sale_price={row.get('sale_price')}")
+                           f"address={address}, sale_price={sale_price}")
                 stats['added'] += 1
                 continue
 
-            try:
-                cursor.execute("""
-                    INSERT INTO sales_log (
-                        property_id, sale_date, address, city, state,
-                        sale_price, purchase_price, purchase_date,
-                        days_held, realized_net, quarter, year,
-                        source, imported_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    property_id,
-                    sale_date,
-                    address,
-                    city,
-                    state,
-                    row.get('sale_price'),
-                    row.get('purchase_price'),
-                    row.get('purchase_date'),
-                    row.get('days_held'),
-                    row.get('realized_net'),
-                    row.get('quarter'),
-                    row.get('year'),
-                    row.get('source'),
-                    row.get('imported_at'),
-                ))
-                stats['added'] += 1
-
-            except sqlite3.IntegrityError as e:
-                # Handle unique constraint violation (sale_date, address)
-                logger.debug(f"Skipping duplicate record: {e}")
-                stats['skipped'] += 1
-            except Exception as e:
-                logger.error(f"Error inserting record {property_id}: {e}")
-                stats['errors'] += 1
+            pending_inserts.append((
+                property_id,
+                sale_date,
+                address,
+                city,
+                state,
+                sale_price,
+                purchase_price,
+                purchase_date,
+                days_held,
+                realized_net,
+                quarter,
+                year,
+                source,
+                imported_at,
+            ))
+            if len(pending_inserts) >= INSERT_BATCH_SIZE:
+                insert_batch(cursor, pending_inserts, stats)
+                pending_inserts.clear()
 
         if not dry_run:
+            if pending_inserts:
+                insert_batch(cursor, pending_inserts, stats)
             conn.commit()
             logger.info("Changes committed to database")
 
@@ -269,6 +402,11 @@ def main():
         action="store_true",
         help="Show what would be imported without making changes"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-sync the CSV even if it is unchanged since the last import"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -297,6 +435,19 @@ def main():
         logger.error(f"Database not found: {DB_PATH}")
         return 1
 
+    # Skip files already synced unchanged (same path, mtime and size).
+    # A dry run never reads or writes the manifest.
+    if not args.dry_run:
+        Database(str(DB_PATH))  # bring the schema (manifest, sale key index) up to date
+        if not args.force:
+            conn = sqlite3.connect(str(DB_PATH))
+            already_imported = is_already_imported(conn, csv_path)
+            conn.close()
+
+            if already_imported:
+                logger.info(f"{csv_path.name} unchanged since last sync, skipping (use --force to re-sync)")
+                return 0
+
     # Load and parse CSV
     df = load_parcl_csv(csv_path)
 
@@ -333,6 +484,8 @@ def main():
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM sales_log")
         count_after = cursor.fetchone()[0]
+        if not stats['errors']:
+            record_import(conn, csv_path, len(df))
         conn.close()
 
         logger.info(f"  Total sales_log records: {count_before} -> {count_after}")
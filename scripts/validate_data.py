@@ -124,7 +124,8 @@ def load_unified_sales(output_dir: Path) -> Optional[pd.DataFrame]:
     if not sales_file:
         return None
 
-    df = pd.read_csv(sales_file)
+    # Coverage flags come back as plain bool columns usable directly as masks
+    df = pd.read_csv(sales_file, dtype={'has_pnl': bool, 'has_details': bool})
     df['sale_date'] = pd.to_datetime(df['sale_date']).dt.date
     if 'purchase_date' in df.columns:
         df['purchase_date'] = pd.to_datetime(df['purchase_date'], errors='coerce').dt.date
@@ -205,7 +206,7 @@ def check_kaz_era_sanity(sales_df: pd.DataFrame) -> ValidationResult:
         )
 
     # Calculate win rate for Kaz era (only for sales with P&L data)
-    kaz_with_pnl = kaz_era_sales[kaz_era_sales['has_pnl'] == True]
+    kaz_with_pnl = kaz_era_sales[kaz_era_sales['has_pnl']]
 
     if len(kaz_with_pnl) > 0:
         wins = (kaz_with_pnl['realized_net'] > 0).sum()
@@ -357,7 +358,7 @@ def check_win_rate_validation(sales_df: pd.DataFrame) -> ValidationResult:
         )
 
     # Filter to sales with P&L data
-    sales_with_pnl = sales_df[sales_df['has_pnl'] == True]
+    sales_with_pnl = sales_df[sales_df['has_pnl']]
 
     if len(sales_with_pnl) == 0:
         return ValidationResult(
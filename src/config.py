@@ -79,6 +79,27 @@ def get_cohort(days_held: int) -> str:
         return 'toxic'
 
 
+COHORT_NAMES = ('new', 'mid', 'old', 'toxic')
+
+
+def get_cohorts(days_held):
+    """Vectorized get_cohort for an array or Series of days held.
+
+    Args:
+        days_held: Array-like of days held (NaN/None treated as unknown)
+
+    Returns:
+        numpy object array of cohort names, 'unknown' where days_held is missing
+    """
+    import numpy as np
+    days = np.asarray(days_held, dtype=float)
+    bounds = np.array([COHORT_NEW_MAX_DAYS, COHORT_MID_MAX_DAYS, COHORT_OLD_MAX_DAYS])
+    labels = np.array(COHORT_NAMES + ('unknown',), dtype=object)
+    idx = np.searchsorted(bounds, days, side='right')
+    idx[np.isnan(days)] = len(COHORT_NAMES)
+    return labels[idx]
+
+
 # =============================================================================
 # SIGNAL THRESHOLDS (for OPS Score and Signal Pack)
 # =============================================================================
@@ -21,7 +21,7 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 
-from src.config import KAZ_ERA_START, is_kaz_era as config_is_kaz_era
+from src.config import KAZ_ERA_START, get_cohort, get_cohorts, is_kaz_era as config_is_kaz_era
 
 logger = logging.getLogger(__name__)
 
@@ -115,14 +115,7 @@ class PendingTracker:
 
     def classify_cohort(self, days_held: int) -> str:
         """Classify home into cohort based on days held."""
-        if days_held < 90:
-            return "new"
-        elif days_held < 180:
-            return "mid"
-        elif days_held < 365:
-            return "old"
-        else:
-            return "toxic"
+        return get_cohort(days_held)
 
     def is_kaz_era(self, purchase_date: str) -> bool:
         """Check if purchase was in Kaz era.
@@ -169,7 +162,8 @@ class PendingTracker:
             pending_df['held'] = pending_df['dom']  # Fallback to DOM
 
         # Classify cohorts
-        pending_df['cohort'] = pending_df['held'].apply(self.classify_cohort)
+        # (a missing days-held value counts as toxic, as it always has here)
+        pending_df['cohort'] = get_cohorts(pending_df['held'].fillna(np.inf))
 
         # Kaz era classification
         if 'od_purchase_date' in pending_df.columns:
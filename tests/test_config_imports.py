@@ -74,6 +74,14 @@ class TestConfigSingleSourceOfTruth:
         assert get_cohort(500) == 'toxic'
         assert get_cohort(None) == 'unknown'
 
+    def test_get_cohorts_matches_get_cohort(self):
+        """Test the vectorized get_cohorts agrees with get_cohort."""
+        from src.config import get_cohort, get_cohorts
+
+        days = [0, 30, 89, 90, 179, 180, 364, 365, 500]
+        assert list(get_cohorts(days)) == [get_cohort(d) for d in days]
+        assert list(get_cohorts([None, float('nan'), 45])) == ['unknown', 'unknown', 'new']
+
 
 class TestNoHardcodedKazEraStart:
     """Verify no module hardcodes KAZ_ERA_START outside of config.py."""
@@ -5,7 +5,7 @@ Tests for database module, including SQL injection prevention.
 import pytest
 import tempfile
 from pathlib import Path
-from src.db.database import Database
+from src.db.database import Database, apply_bulk_pragmas
 
 
 class TestDatabaseInitialization:
@@ -41,6 +41,47 @@ class TestDatabaseInitialization:
 
             conn.close()
 
+    def test_sales_log_import_columns_added_once(self):
+        """Test sales_log gains the Parcl sync columns and reopening is idempotent."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            Database(str(db_path))
+            db = Database(str(db_path))
+
+            conn = db._get_conn()
+            columns = [row['name'] for row in conn.execute("PRAGMA table_info(sales_log)")]
+            conn.close()
+
+            for name, _ in Database._SALES_LOG_ADDED_COLUMNS:
+                assert columns.count(name) == 1
+
+    def test_sales_key_index_dedups_legacy_rows(self):
+        """Test legacy duplicate (property_id, sale_date) rows are dropped before indexing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(str(db_path))
+
+            conn = db._get_conn()
+            conn.execute("DROP INDEX ux_sales_property_date")
+            conn.executemany(
+                "INSERT INTO sales_log (property_id, sale_date, address) VALUES (?, ?, ?)",
+                [('p1', '2026-01-05', 'a'), ('p1', '2026-01-05', 'b'),
+                 ('p1', '2026-01-06', 'c'), (None, '2026-01-05', 'd'), (None, '2026-01-05', 'e')],
+            )
+            conn.commit()
+            conn.close()
+
+            db = Database(str(db_path))
+            conn = db._get_conn()
+            addresses = [row['address'] for row in conn.execute("SELECT address FROM sales_log ORDER BY id")]
+            index = conn.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'ux_sales_property_date'"
+            ).fetchone()
+            conn.close()
+
+            assert addresses == ['a', 'c', 'd', 'e']
+            assert index is not None
+
 
 class TestValidMetrics:
     """Test valid metric whitelist."""
@@ -149,3 +190,61 @@ class TestInitialToxicCount:
 
             result = db.get_initial_toxic_count()
             assert result == 0
+
+
+class TestBulkPragmas:
+    """Test bulk import connection tuning."""
+
+    def test_apply_bulk_pragmas(self):
+        """Test that bulk PRAGMAs switch to WAL with relaxed sync."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(str(db_path))
+
+            conn = db._get_conn()
+            apply_bulk_pragmas(conn)
+
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+            conn.close()
+
+    def test_apply_bulk_pragmas_without_wal(self):
+        """Test that daily-run PRAGMAs leave the journal mode alone."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(str(db_path))
+
+            conn = db._get_conn()
+            apply_bulk_pragmas(conn, wal=False)
+
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'delete'
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+            conn.close()
+
+
+class TestUpsertPropertySnapshots:
+    """Test batched property snapshot upserts."""
+
+    def test_failed_batch_rolls_back_and_releases_lock(self):
+        """Test a failing snapshot rolls back the batch and frees the write lock."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(str(db_path))
+            snapshot = {
+                'address': '1 Main St', 'city': 'Phoenix', 'state': 'AZ',
+                'zip_code': '85001', 'status': 'active', 'list_price': 300000,
+            }
+
+            with pytest.raises(AttributeError):
+                db.upsert_property_snapshots([snapshot, None])
+
+            conn = db._get_conn()
+            count = conn.execute("SELECT COUNT(*) FROM property_daily_snapshot").fetchone()[0]
+            conn.close()
+            assert count == 0
+
+            results = db.upsert_property_snapshots([snapshot])
+            assert results[0][1] is True
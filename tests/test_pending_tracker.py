@@ -3,10 +3,11 @@ Tests for pending tracker module.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from src.metrics.pending_tracker import PendingTracker, PendingMetrics
-from src.config import KAZ_ERA_START, KAZ_ERA_START_STR
+from src.config import KAZ_ERA_START, KAZ_ERA_START_STR, get_cohorts
 
 
 class TestCohortClassification:
@@ -37,6 +38,20 @@ class TestCohortClassification:
         assert tracker.classify_cohort(500) == "toxic"
 
 
+class TestVectorizedCohorts:
+    """Test get_cohorts agrees with the per-row cohort rules."""
+
+    def test_matches_classify_cohort_at_boundaries(self):
+        """Test every boundary lands in the same cohort as classify_cohort."""
+        tracker = PendingTracker()
+        days = [0, 30, 89, 90, 179, 180, 364, 365, 500]
+        assert list(get_cohorts(days)) == [tracker.classify_cohort(d) for d in days]
+
+    def test_missing_days_are_unknown(self):
+        """Test NaN/None days held are labelled unknown."""
+        assert list(get_cohorts(pd.Series([None, np.nan, 45]))) == ["unknown", "unknown", "new"]
+
+
 class TestKazEraClassification:
     """Test Kaz era classification.
 
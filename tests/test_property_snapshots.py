@@ -215,6 +215,86 @@ class TestPropertySnapshotDatabase:
         assert stats['total_value'] > 0
 
 
+class TestBatchPropertySnapshots:
+    """Test batch snapshot upserts."""
+
+    @pytest.fixture
+    def db(self):
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        db = Database(db_path)
+        yield db
+        Path(db_path).unlink(missing_ok=True)
+
+    def test_batch_matches_single_upserts(self, db):
+        """Test batch upsert returns same IDs and new flags as single upserts."""
+        snapshots = [
+            {'address': f'{300+i} Batch Ln', 'city': 'Phoenix', 'state': 'AZ',
+             'market': 'phoenix-az', 'list_price': 400000 + i, 'status': 'FOR_SALE'}
+            for i in range(3)
+        ]
+        # Same property twice in one batch: second is not new
+        snapshots.append(dict(snapshots[0], list_price=390000))
+
+        results = db.upsert_property_snapshots(snapshots, batch_size=2)
+
+        assert [r[0] for r in results] == [
+            generate_property_id(s['address'], s['city'], s['state']) for s in snapshots
+        ]
+        assert [r[1] for r in results] == [True, True, True, False]
+
+        stats = db.get_inventory_snapshot_stats()
+        assert stats['total_tracked'] == 3
+        history = db.get_property_history(results[0][0])
+        assert history[0]['list_price'] == 390000
+        assert history[0]['price_cuts_count'] == 1
+
+    def test_batch_detects_status_transition(self, db):
+        """Test batch upsert detects transitions against stored snapshots."""
+        snapshot = {'address': '456 Oak Ave', 'city': 'Dallas', 'state': 'TX',
+                    'market': 'dallas-tx', 'list_price': 350000, 'status': 'FOR_SALE'}
+        property_id, _, _ = db.upsert_property_snapshot(snapshot)
+
+        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        conn = db._get_conn()
+        conn.execute("UPDATE property_daily_snapshot SET snapshot_date = ? WHERE property_id = ?",
+                     (yesterday, property_id))
+        conn.commit()
+        conn.close()
+
+        results = db.upsert_property_snapshots([dict(snapshot, status='PENDING')])
+
+        _, is_new, transition = results[0]
+        assert is_new == False
+        assert transition['from_status'] == 'FOR_SALE'
+        assert transition['to_status'] == 'PENDING'
+        assert transition['days_in_previous_status'] == 1
+        assert len(db.get_status_transitions()) == 1
+
+    def test_batch_defer_indexes_restores_indexes(self, db):
+        """Test deferred indexes are rebuilt after the batch load."""
+        def index_names():
+            conn = db._get_conn()
+            names = {row['name'] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")}
+            conn.close()
+            return names
+
+        before = index_names()
+        snapshots = [
+            {'address': f'{500+i} Defer Ct', 'city': 'Austin', 'state': 'TX',
+             'market': 'austin-tx', 'list_price': 300000 + i, 'status': 'FOR_SALE'}
+            for i in range(5)
+        ]
+
+        results = db.upsert_property_snapshots(snapshots, defer_indexes=True)
+
+        assert len(results) == 5
+        assert db.get_inventory_snapshot_stats()['total_tracked'] == 5
+        assert 'idx_snapshot_date' in before
+        assert index_names() == before
+
+
 class TestStatusTransitions:
     """Test status transition tracking."""
 
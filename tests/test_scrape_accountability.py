@@ -0,0 +1,150 @@
+"""
+Tests for accountability page weekly contract extraction.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("requests")
+
+import scripts.scrape_accountability as sa
+from scripts.scrape_accountability import extract_weekly_contracts
+
+
+def _direct(week, actual, last_year=0):
+    """Strategy 1: plain JSON data point."""
+    return '{"month":"%s","actual":%d,"high":1,"low":0,"lastYear":%d}' % (week, actual, last_year)
+
+
+def _unicode(week, actual):
+    """Strategy 2: \\u0022-escaped quotes."""
+    return '{\\u0022month\\u0022:\\u0022%s\\u0022,\\u0022actual\\u0022:%d' % (week, actual)
+
+
+def _script(week, actual):
+    """Strategy 3: loose JSON inside a script block."""
+    return '<script>var d = {"month" : "%s" , "actual" : %d};</script>' % (week, actual)
+
+
+def _escaped(week, actual):
+    """Strategy 4: backslash-escaped JSON in an attribute."""
+    return '<div data-x="{\\"month\\":\\"%s\\",\\"actual\\":%d}"></div>' % (week, actual)
+
+
+def _next_data(records):
+    return ('<script id="__NEXT_DATA__" type="application/json">%s</script>'
+            % json.dumps({'props': {'pageProps': {'series': records}}}))
+
+
+def _weeks(html):
+    return [(w['week'], w['actual'], w['last_year']) for w in extract_weekly_contracts(html)]
+
+
+class TestStrategyPrecedence:
+    """Test which extraction strategy wins when several formats are present."""
+
+    def test_next_data_wins_over_regex(self):
+        """Test __NEXT_DATA__ records are used and the regex strategies ignored."""
+        html = _next_data([{'month': '2026-01-05', 'actual': 12, 'lastYear': 8}]) + _direct('2026-01-12', 99)
+        assert _weeks(html) == [('2026-01-05', 12, 8)]
+
+    def test_unusable_next_data_falls_back_to_regex(self):
+        """Test a __NEXT_DATA__ blob without usable records falls back."""
+        html = _next_data([{'month': 'Jan 2026', 'actual': 12}]) + _direct('2026-01-12', 9, 4)
+        assert _weeks(html) == [('2026-01-12', 9, 4)]
+
+    def test_direct_wins_over_unicode(self):
+        """Test strategy 1 beats strategy 2."""
+        html = _direct('2026-01-05', 7, 3) + _unicode('2026-01-12', 8)
+        assert _weeks(html) == [('2026-01-05', 7, 3)]
+
+    def test_unicode_wins_over_script(self):
+        """Test strategy 2 beats strategy 3."""
+        html = _unicode('2026-01-05', 7) + _script('2026-01-12', 8)
+        assert _weeks(html) == [('2026-01-05', 7, 0)]
+
+    def test_script_wins_over_escaped(self):
+        """Test strategy 3 beats strategy 4."""
+        html = _script('2026-01-05', 7) + _escaped('2026-01-12', 8)
+        assert _weeks(html) == [('2026-01-05', 7, 0)]
+
+    def test_escaped_only(self):
+        """Test strategy 4 is used when nothing else matches."""
+        assert _weeks(_escaped('2026-01-12', 8)) == [('2026-01-12', 8, 0)]
+
+    def test_no_data(self):
+        """Test a page without data points yields no weeks."""
+        assert _weeks('<html><body>nothing here</body></html>') == []
+
+
+class TestWeekCollection:
+    """Test projection skipping and week dedup."""
+
+    def test_projections_skipped(self):
+        """Test actual=0 projection points are dropped."""
+        html = '[' + ','.join([_direct('2026-01-05', 7), _direct('2026-01-12', 0)]) + ']'
+        assert _weeks(html) == [('2026-01-05', 7, 0)]
+
+    def test_first_point_for_a_week_wins(self):
+        """Test a repeated week keeps its first data point."""
+        html = '[' + ','.join([_direct('2026-01-05', 7, 1), _direct('2026-01-05', 99, 2)]) + ']'
+        assert _weeks(html) == [('2026-01-05', 7, 1)]
+
+    def test_projection_does_not_claim_week(self):
+        """Test a projection doesn't block a later real point for the same week."""
+        html = '[' + ','.join([_direct('2026-01-05', 0), _direct('2026-01-05', 5)]) + ']'
+        assert _weeks(html) == [('2026-01-05', 5, 0)]
+
+    def test_weeks_sorted(self):
+        """Test output is sorted by week regardless of page order."""
+        html = '[' + ','.join([_direct('2026-01-12', 2), _direct('2025-12-29', 1)]) + ']'
+        assert [w[0] for w in _weeks(html)] == ['2025-12-29', '2026-01-12']
+
+
+class _Response:
+    def __init__(self, html):
+        self.text = html
+        self.headers = {'Content-Type': 'text/html; charset=utf-8'}
+
+    def raise_for_status(self):
+        pass
+
+
+class TestLatestStats:
+    """Test the latest-week, 4-week average and Q1 figures."""
+
+    @staticmethod
+    def _latest(monkeypatch, points):
+        html = '[' + ','.join(_direct(week, actual) for week, actual in points) + ']'
+        monkeypatch.setattr(sa._SESSION, 'get', lambda url, timeout=None: _Response(html))
+        return sa.scrape_accountability()['latest']
+
+    def test_latest_wow_4w_and_q1(self, monkeypatch):
+        """Test stats when Q1 is shorter than the 4-week window."""
+        latest = self._latest(monkeypatch, [
+            ('2025-12-08', 100), ('2025-12-15', 110), ('2025-12-22', 120),
+            ('2025-12-29', 130), ('2026-01-05', 140), ('2026-01-12', 150),
+        ])
+        assert latest['week'] == '2026-01-12'
+        assert latest['contracts'] == 150
+        assert latest['wow_change'] == 7.1
+        assert latest['avg_4w'] == 135.0
+        assert latest['q1_total'] == 290
+        assert latest['q1_weeks'] == 2
+
+    def test_q1_longer_than_4w_window(self, monkeypatch):
+        """Test the Q1 total keeps counting past the last four weeks."""
+        latest = self._latest(monkeypatch, [
+            ('2025-12-29', 50), ('2026-01-05', 10), ('2026-01-12', 20),
+            ('2026-01-19', 30), ('2026-01-26', 40), ('2026-02-02', 50),
+        ])
+        assert latest['avg_4w'] == 35.0
+        assert latest['q1_total'] == 150
+        assert latest['q1_weeks'] == 5
+
+    def test_fewer_than_four_weeks(self, monkeypatch):
+        """Test the average covers only the weeks available."""
+        latest = self._latest(monkeypatch, [('2026-01-05', 10), ('2026-01-12', 21)])
+        assert latest['avg_4w'] == 15.5
+        assert latest['q1_total'] == 31
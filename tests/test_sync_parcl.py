@@ -0,0 +1,108 @@
+"""
+Tests for Parcl CSV sync helpers.
+"""
+
+from scripts.sync_parcl_to_db import parse_date
+
+
+class TestParseDate:
+    """Test Parcl date parsing."""
+
+    def test_parse_iso_date(self):
+        """Test zero-padded ISO dates pass through."""
+        assert parse_date("2026-01-29") == "2026-01-29"
+
+    def test_parse_iso_date_without_padding(self):
+        """Test ISO dates without zero padding are normalized."""
+        assert parse_date("2026-1-5") == "2026-01-05"
+        assert parse_date("2026-11-5") == "2026-11-05"
+
+    def test_parse_month_name_date(self):
+        """Test Parcl's "Jan 29, 2026" format."""
+        assert parse_date("Jan 29, 2026") == "2026-01-29"
+
+    def test_parse_invalid_date(self):
+        """Test unparseable and empty values return None."""
+        assert parse_date("2026-13-01") is None
+        assert parse_date("not a date") is None
+        assert parse_date("") is None
+        assert parse_date(None) is None
+
+
+class TestLoadParclCsv:
+    """Test chunked Parcl CSV loading."""
+
+    def test_property_id_stable_across_chunks(self, tmp_path, monkeypatch):
+        """Test a chunk with a blank property_id doesn't turn IDs into floats."""
+        import scripts.sync_parcl_to_db as sync
+
+        csv_path = tmp_path / "opendoor-home-sales-test.csv"
+        csv_path.write_text(
+            "Property ID,Sale Date,Sale Price,Days Held\n"
+            "123,2026-01-05,\"$400,000\",30\n"
+            "456,2026-01-06,\"$350,000\",45\n"
+            ",2026-01-07,\"$300,000\",60\n"
+            "789,2026-01-08,\"$500,000\",90\n"
+        )
+        monkeypatch.setattr(sync, 'CSV_CHUNK_SIZE', 2)
+
+        df = sync.load_parcl_csv(csv_path)
+
+        assert list(df['property_id']) == ['123', '456', '789']
+        assert list(df['sale_date']) == ['2026-01-05', '2026-01-06', '2026-01-08']
+
+
+class TestImportManifest:
+    """Test the import manifest that skips unchanged CSVs."""
+
+    @staticmethod
+    def _setup(tmp_path, monkeypatch):
+        import sqlite3
+        import scripts.sync_parcl_to_db as sync
+        from src.db.database import Database
+
+        # A database created before the manifest existed
+        db_path = tmp_path / "glasshouse.db"
+        Database(str(db_path))
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("DROP TABLE import_manifest")
+        conn.close()
+        csv_path = tmp_path / "opendoor-home-sales-test.csv"
+        csv_path.write_text(
+            "Property ID,Sale Date,Sale Price,Days Held\n"
+            "123,2026-01-05,\"$400,000\",30\n"
+        )
+        monkeypatch.setattr(sync, 'DB_PATH', db_path)
+        return sync, db_path, csv_path
+
+    @staticmethod
+    def _tables(db_path):
+        import sqlite3
+        conn = sqlite3.connect(str(db_path))
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        conn.close()
+        return tables
+
+    def test_dry_run_leaves_manifest_untouched(self, tmp_path, monkeypatch):
+        """Test --dry-run neither creates nor consults the manifest."""
+        sync, db_path, csv_path = self._setup(tmp_path, monkeypatch)
+        monkeypatch.setattr('sys.argv', ['sync', '--csv', str(csv_path), '--dry-run'])
+
+        assert sync.main() == 0
+        assert 'import_manifest' not in self._tables(db_path)
+
+    def test_unchanged_csv_skipped_but_dry_run_still_reports(self, tmp_path, monkeypatch):
+        """Test a synced CSV is skipped on re-run, while a dry run still loads it."""
+        sync, db_path, csv_path = self._setup(tmp_path, monkeypatch)
+        monkeypatch.setattr('sys.argv', ['sync', '--csv', str(csv_path)])
+        assert sync.main() == 0
+
+        loaded = []
+        real_load = sync.load_parcl_csv
+        monkeypatch.setattr(sync, 'load_parcl_csv', lambda p: loaded.append(p) or real_load(p))
+        assert sync.main() == 0
+        assert loaded == []
+
+        monkeypatch.setattr('sys.argv', ['sync', '--csv', str(csv_path), '--dry-run'])
+        assert sync.main() == 0
+        assert loaded == [csv_path]